@@ -31,20 +31,38 @@ Example:
 
 from __future__ import annotations
 
+from collections import ChainMap
+from collections.abc import Mapping
+from functools import cached_property
+from types import MappingProxyType
 from typing import Any
 
 from django.conf import settings
+from django.core.signals import setting_changed
+
+# Read-only so a stray write in one test can't leak into every later settings lookup
+DEFAULTS: Mapping[str, Any] = MappingProxyType(
+    {
+        # Transaction behavior
+        "ATOMIC": True,
+        # Audit logging
+        "AUDIT_LOG": True,  # Enable automatic audit logging
+        "AUDIT_LOG_MODE": "transaction",  # 'transaction' (default, rolls back together) or 'signal' (decoupled)
+        "AUDIT_LOG_MODEL": None,  # Custom audit log model (e.g., 'myapp.TransitionLog')
+        # Field defaults
+        "PROTECTED_FIELDS": False,
+    }
+)
+
+
+def _setting(name: str) -> cached_property[Any]:
+    """Build a per-instance cached accessor for one setting."""
+
+    def getter(self: FSMRXSettings) -> Any:
+        return self._settings[name]
 
-DEFAULTS = {
-    # Transaction behavior
-    "ATOMIC": True,
-    # Audit logging
-    "AUDIT_LOG": True,  # Enable automatic audit logging
-    "AUDIT_LOG_MODE": "transaction",  # 'transaction' (default, rolls back together) or 'signal' (decoupled)
-    "AUDIT_LOG_MODEL": None,  # Custom audit log model (e.g., 'myapp.TransitionLog')
-    # Field defaults
-    "PROTECTED_FIELDS": False,
-}
+    getter.__name__ = name
+    return cached_property(getter)
 
 
 class FSMRXSettings:
@@ -52,6 +70,8 @@ class FSMRXSettings:
     Settings object for django-fsm-rx.
 
     Reads from Django settings.DJANGO_FSM_RX dict, falling back to defaults.
+    Each setting is cached on the instance after first access, so hot paths
+    pay a plain attribute lookup.
 
     Usage:
         from django_fsm_rx.conf import fsm_rx_settings
@@ -60,17 +80,25 @@ class FSMRXSettings:
             # do audit logging
     """
 
+    ATOMIC = _setting("ATOMIC")
+    AUDIT_LOG = _setting("AUDIT_LOG")
+    AUDIT_LOG_MODE = _setting("AUDIT_LOG_MODE")
+    AUDIT_LOG_MODEL = _setting("AUDIT_LOG_MODEL")
+    PROTECTED_FIELDS = _setting("PROTECTED_FIELDS")
+
     def __init__(self) -> None:
-        self._cached_settings: dict[str, Any] | None = None
+        self._cached_settings: Mapping[str, Any] | None = None
 
     @property
-    def _settings(self) -> dict[str, Any]:
+    def _settings(self) -> Mapping[str, Any]:
         if self._cached_settings is None:
+            # Layer user settings over the defaults without copying either mapping
             user_settings = getattr(settings, "DJANGO_FSM_RX", {})
-            self._cached_settings = {**DEFAULTS, **user_settings}
+            self._cached_settings = ChainMap(user_settings, DEFAULTS)
         return self._cached_settings
 
     def __getattr__(self, name: str) -> Any:
+        # Only reached for names without a cached accessor above
         if name.startswith("_"):
             raise AttributeError(name)
 
@@ -81,8 +109,19 @@ class FSMRXSettings:
 
     def clear_cache(self) -> None:
         """Clear cached settings. Useful for testing."""
+        for name in DEFAULTS:
+            self.__dict__.pop(name, None)
         self._cached_settings = None
 
 
 # Singleton instance
 fsm_rx_settings = FSMRXSettings()
+
+
+def reload_fsm_rx_settings(*, setting: str, **kwargs: Any) -> None:
+    """Clear the cached settings when DJANGO_FSM_RX changes (e.g. via override_settings)."""
+    if setting == "DJANGO_FSM_RX":
+        fsm_rx_settings.clear_cache()
+
+
+setting_changed.connect(reload_fsm_rx_settings)
@@ -25,6 +25,27 @@ from typing import Any
 from django.core.management.base import BaseCommand
 from django.core.management.base import CommandError
 
+_CHANGELOG_TITLE_RE = re.compile(r"Changelog\n=+\n\n")
+
+
+# Kept in step with _parse_version in scripts/bump_version.py, which runs standalone and can't import this package
+def _parse_version(version: str) -> tuple[int, int, int]:
+    """Parse an X.Y.Z version string into its integer components.
+
+    Raises ValueError naming the offending component.
+    """
+    parts = version.split(".")
+    if len(parts) != 3:
+        raise ValueError(f"expected 3 components, got {len(parts)}")
+    for part in parts:
+        # isascii() rejects non-ASCII digits that isdigit() would accept
+        if not (part.isascii() and part.isdigit()):
+            raise ValueError(f"component {part!r} is not a number")
+        if len(part) > 1 and part.startswith("0"):
+            raise ValueError(f"component {part!r} has a leading zero")
+    major, minor, patch = (int(part) for part in parts)
+    return major, minor, patch
+
 
 class Command(BaseCommand):
     """Management command to bump version and create release."""
@@ -76,8 +97,10 @@ class Command(BaseCommand):
         no_changelog = options["no_changelog"]
 
         # Validate version format
-        if not re.match(r"^\d+\.\d+\.\d+$", version):
-            raise CommandError(f"Invalid version format: {version}. Expected format: X.Y.Z")
+        try:
+            _parse_version(version)
+        except ValueError as e:
+            raise CommandError(f"Invalid version format: {version} ({e}). Expected format: X.Y.Z") from e
 
         # Find project root (where pyproject.toml is)
         project_root = self._find_project_root()
@@ -226,11 +249,10 @@ class Command(BaseCommand):
         entries = "\n".join(f"- {msg}" for msg in messages)
         new_entry = f"{header}\n{underline}\n\n{entries}\n\n\n"
 
-        # Insert after the main title
-        # Look for the pattern: Changelog\n=========\n\n
-        pattern = r"(Changelog\n=+\n\n)"
-        if re.search(pattern, content):
-            new_content = re.sub(pattern, f"\\1{new_entry}", content, count=1)
+        # Insert after the main title; slicing avoids re.sub treating backslashes in messages as escapes
+        match = _CHANGELOG_TITLE_RE.search(content)
+        if match:
+            new_content = content[: match.end()] + new_entry + content[match.end() :]
         else:
             # Fallback: prepend to file
             new_content = f"Changelog\n=========\n\n{new_entry}{content}"
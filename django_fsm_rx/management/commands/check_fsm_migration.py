@@ -57,6 +57,11 @@ class Command(BaseCommand):
             action="store_true",
             help="Output results as JSON",
         )
+        parser.add_argument(
+            "--parallel",
+            action="store_true",
+            help="Scan large trees in worker processes (the calling script must be safe to re-import)",
+        )
 
     def handle(self, *args: Any, **options: Any) -> None:
         """Execute the command."""
@@ -80,7 +85,8 @@ class Command(BaseCommand):
         # Scan for deprecated imports
         if not options["json"]:
             self.stdout.write(f"Scanning {path_obj} for deprecated django-fsm imports...")
-        report = scan_imports_in_directory(path_obj, exclude_patterns=exclude_patterns)
+        # Worker processes are opt-in: call_command() from an unguarded script can't spawn them safely
+        report = scan_imports_in_directory(path_obj, exclude_patterns=exclude_patterns, parallel=options["parallel"])
 
         # Output results
         if options["json"]:
@@ -94,6 +100,8 @@ class Command(BaseCommand):
         """Output a summary of the migration status."""
         if report.is_fully_migrated:
             self.stdout.write(self.style.SUCCESS("No deprecated imports found. Your code is ready for django_fsm_rx!"))
+            # Files that couldn't be read still need a look
+            self._output_warnings(report)
             return
 
         self.stdout.write("")
@@ -124,6 +132,10 @@ class Command(BaseCommand):
         self.stdout.write(self.style.NOTICE("To fix these imports, update your code as shown above."))
         self.stdout.write(self.style.NOTICE("See https://github.com/specialorange/django-fsm-rx for migration guide."))
 
+        self._output_warnings(report)
+
+    def _output_warnings(self, report: MigrationReport) -> None:
+        """Output the report's warnings, if any."""
         if report.warnings:
             self.stdout.write("")
             self.stdout.write(self.style.WARNING("Warnings:"))
@@ -134,7 +146,7 @@ class Command(BaseCommand):
         """Output detailed migration information."""
         self._output_summary(report)
 
-        if not report.is_fully_migrated and report.deprecated_imports:
+        if report.deprecated_imports:
             self.stdout.write("")
             self.stdout.write(self.style.NOTICE("=" * 60))
             self.stdout.write(self.style.NOTICE("Migration Notes"))
@@ -161,7 +173,7 @@ class Command(BaseCommand):
 
         data = {
             "is_fully_migrated": report.is_fully_migrated,
-            "files_affected": report.files_affected,
+            "files_affected": sorted(report.files_affected),
             "deprecated_imports": report.deprecated_imports,
             "warnings": report.warnings,
             "suggested_changes": report.suggested_changes,
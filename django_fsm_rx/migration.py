@@ -47,14 +47,25 @@ After (single package):
 
 from __future__ import annotations
 
+import ast
+import functools
+import os
 import re
 import warnings
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 from typing import Any
-from typing import TypedDict
+from typing import Final
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from django.db.models import Model
 
 __all__ = [
@@ -62,256 +73,300 @@ __all__ = [
     "MigrationReport",
     "scan_imports_in_file",
     "scan_imports_in_directory",
+    "iter_deprecated_imports",
+    "is_file_migrated",
     "get_import_replacements",
+    "IMPORT_REPLACEMENTS",
     "validate_model_fsm_compatibility",
     "IMPORT_MAPPINGS",
 ]
 
 
-class ImportMapping(TypedDict):
-    """Mapping from old import to new import."""
+@dataclass(frozen=True, slots=True)
+class ImportMapping(Mapping[str, str]):
+    """
+    Mapping from old import to new import.
+
+    Mappings used to be dicts, so this is also a read-only ``Mapping`` over its
+    field names: ``mapping["old_module"]``, ``"notes" in mapping``, ``mapping.get()``
+    and ``dict(mapping)`` keep working, including ``mapping == dict(mapping)``.
+    """
 
     old_module: str
     old_name: str
     new_module: str
     new_name: str
-    notes: str
+    notes: str = ""
+
+    def __getitem__(self, key: str) -> str:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    # Defined here so @dataclass keeps them: its generated __eq__ would only match other ImportMappings
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.items()))
 
 
 # Comprehensive mapping of old imports to new imports
 IMPORT_MAPPINGS: list[ImportMapping] = [
     # Core django-fsm / django-fsm-2 imports
-    {
-        "old_module": "django_fsm",
-        "old_name": "FSMField",
-        "new_module": "django_fsm_rx",
-        "new_name": "FSMField",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm",
-        "old_name": "FSMIntegerField",
-        "new_module": "django_fsm_rx",
-        "new_name": "FSMIntegerField",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm",
-        "old_name": "FSMKeyField",
-        "new_module": "django_fsm_rx",
-        "new_name": "FSMKeyField",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm",
-        "old_name": "transition",
-        "new_module": "django_fsm_rx",
-        "new_name": "transition",
-        "notes": "Direct replacement. New features: on_success, on_commit, atomic callbacks",
-    },
-    {
-        "old_module": "django_fsm",
-        "old_name": "can_proceed",
-        "new_module": "django_fsm_rx",
-        "new_name": "can_proceed",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm",
-        "old_name": "has_transition_perm",
-        "new_module": "django_fsm_rx",
-        "new_name": "has_transition_perm",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm",
-        "old_name": "TransitionNotAllowed",
-        "new_module": "django_fsm_rx",
-        "new_name": "TransitionNotAllowed",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm",
-        "old_name": "ConcurrentTransition",
-        "new_module": "django_fsm_rx",
-        "new_name": "ConcurrentTransition",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm",
-        "old_name": "ConcurrentTransitionMixin",
-        "new_module": "django_fsm_rx",
-        "new_name": "ConcurrentTransitionMixin",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm",
-        "old_name": "FSMFieldMixin",
-        "new_module": "django_fsm_rx",
-        "new_name": "FSMFieldMixin",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm",
-        "old_name": "RETURN_VALUE",
-        "new_module": "django_fsm_rx",
-        "new_name": "RETURN_VALUE",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm",
-        "old_name": "GET_STATE",
-        "new_module": "django_fsm_rx",
-        "new_name": "GET_STATE",
-        "notes": "Direct replacement, API identical",
-    },
+    ImportMapping(
+        old_module="django_fsm",
+        old_name="FSMField",
+        new_module="django_fsm_rx",
+        new_name="FSMField",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm",
+        old_name="FSMIntegerField",
+        new_module="django_fsm_rx",
+        new_name="FSMIntegerField",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm",
+        old_name="FSMKeyField",
+        new_module="django_fsm_rx",
+        new_name="FSMKeyField",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm",
+        old_name="transition",
+        new_module="django_fsm_rx",
+        new_name="transition",
+        notes="Direct replacement. New features: on_success, on_commit, atomic callbacks",
+    ),
+    ImportMapping(
+        old_module="django_fsm",
+        old_name="can_proceed",
+        new_module="django_fsm_rx",
+        new_name="can_proceed",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm",
+        old_name="has_transition_perm",
+        new_module="django_fsm_rx",
+        new_name="has_transition_perm",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm",
+        old_name="TransitionNotAllowed",
+        new_module="django_fsm_rx",
+        new_name="TransitionNotAllowed",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm",
+        old_name="ConcurrentTransition",
+        new_module="django_fsm_rx",
+        new_name="ConcurrentTransition",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm",
+        old_name="ConcurrentTransitionMixin",
+        new_module="django_fsm_rx",
+        new_name="ConcurrentTransitionMixin",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm",
+        old_name="FSMFieldMixin",
+        new_module="django_fsm_rx",
+        new_name="FSMFieldMixin",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm",
+        old_name="RETURN_VALUE",
+        new_module="django_fsm_rx",
+        new_name="RETURN_VALUE",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm",
+        old_name="GET_STATE",
+        new_module="django_fsm_rx",
+        new_name="GET_STATE",
+        notes="Direct replacement, API identical",
+    ),
     # django-fsm-2 specific
-    {
-        "old_module": "django_fsm_2",
-        "old_name": "FSMField",
-        "new_module": "django_fsm_rx",
-        "new_name": "FSMField",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm_2",
-        "old_name": "FSMIntegerField",
-        "new_module": "django_fsm_rx",
-        "new_name": "FSMIntegerField",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm_2",
-        "old_name": "FSMKeyField",
-        "new_module": "django_fsm_rx",
-        "new_name": "FSMKeyField",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm_2",
-        "old_name": "transition",
-        "new_module": "django_fsm_rx",
-        "new_name": "transition",
-        "notes": "Direct replacement. New features: on_success, on_commit, atomic callbacks",
-    },
-    {
-        "old_module": "django_fsm_2",
-        "old_name": "can_proceed",
-        "new_module": "django_fsm_rx",
-        "new_name": "can_proceed",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm_2",
-        "old_name": "has_transition_perm",
-        "new_module": "django_fsm_rx",
-        "new_name": "has_transition_perm",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm_2",
-        "old_name": "TransitionNotAllowed",
-        "new_module": "django_fsm_rx",
-        "new_name": "TransitionNotAllowed",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm_2",
-        "old_name": "ConcurrentTransition",
-        "new_module": "django_fsm_rx",
-        "new_name": "ConcurrentTransition",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm_2",
-        "old_name": "ConcurrentTransitionMixin",
-        "new_module": "django_fsm_rx",
-        "new_name": "ConcurrentTransitionMixin",
-        "notes": "Direct replacement, API identical",
-    },
+    ImportMapping(
+        old_module="django_fsm_2",
+        old_name="FSMField",
+        new_module="django_fsm_rx",
+        new_name="FSMField",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm_2",
+        old_name="FSMIntegerField",
+        new_module="django_fsm_rx",
+        new_name="FSMIntegerField",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm_2",
+        old_name="FSMKeyField",
+        new_module="django_fsm_rx",
+        new_name="FSMKeyField",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm_2",
+        old_name="transition",
+        new_module="django_fsm_rx",
+        new_name="transition",
+        notes="Direct replacement. New features: on_success, on_commit, atomic callbacks",
+    ),
+    ImportMapping(
+        old_module="django_fsm_2",
+        old_name="can_proceed",
+        new_module="django_fsm_rx",
+        new_name="can_proceed",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm_2",
+        old_name="has_transition_perm",
+        new_module="django_fsm_rx",
+        new_name="has_transition_perm",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm_2",
+        old_name="TransitionNotAllowed",
+        new_module="django_fsm_rx",
+        new_name="TransitionNotAllowed",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm_2",
+        old_name="ConcurrentTransition",
+        new_module="django_fsm_rx",
+        new_name="ConcurrentTransition",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm_2",
+        old_name="ConcurrentTransitionMixin",
+        new_module="django_fsm_rx",
+        new_name="ConcurrentTransitionMixin",
+        notes="Direct replacement, API identical",
+    ),
     # django-fsm-admin
-    {
-        "old_module": "django_fsm_admin.mixins",
-        "old_name": "FSMTransitionMixin",
-        "new_module": "django_fsm_rx.admin",
-        "new_name": "FSMAdminMixin",
-        "notes": "FSMTransitionMixin is aliased to FSMAdminMixin for compatibility",
-    },
-    {
-        "old_module": "django_fsm_admin",
-        "old_name": "FSMTransitionMixin",
-        "new_module": "django_fsm_rx.admin",
-        "new_name": "FSMAdminMixin",
-        "notes": "FSMTransitionMixin is aliased to FSMAdminMixin for compatibility",
-    },
+    ImportMapping(
+        old_module="django_fsm_admin.mixins",
+        old_name="FSMTransitionMixin",
+        new_module="django_fsm_rx.admin",
+        new_name="FSMAdminMixin",
+        notes="FSMTransitionMixin is aliased to FSMAdminMixin for compatibility",
+    ),
+    ImportMapping(
+        old_module="django_fsm_admin",
+        old_name="FSMTransitionMixin",
+        new_module="django_fsm_rx.admin",
+        new_name="FSMAdminMixin",
+        notes="FSMTransitionMixin is aliased to FSMAdminMixin for compatibility",
+    ),
     # django-fsm-log
-    {
-        "old_module": "django_fsm_log.models",
-        "old_name": "StateLog",
-        "new_module": "django_fsm_rx",
-        "new_name": "FSMTransitionLog",
-        "notes": "StateLog aliased to FSMTransitionLog. Can still use from django_fsm_log.models",
-    },
-    {
-        "old_module": "django_fsm_log.decorators",
-        "old_name": "fsm_log_by",
-        "new_module": "django_fsm_rx.log",
-        "new_name": "fsm_log_by",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm_log.decorators",
-        "old_name": "fsm_log_description",
-        "new_module": "django_fsm_rx.log",
-        "new_name": "fsm_log_description",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm_log",
-        "old_name": "fsm_log_by",
-        "new_module": "django_fsm_rx.log",
-        "new_name": "fsm_log_by",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm_log",
-        "old_name": "fsm_log_description",
-        "new_module": "django_fsm_rx.log",
-        "new_name": "fsm_log_description",
-        "notes": "Direct replacement, API identical",
-    },
+    ImportMapping(
+        old_module="django_fsm_log.models",
+        old_name="StateLog",
+        new_module="django_fsm_rx",
+        new_name="FSMTransitionLog",
+        notes="StateLog aliased to FSMTransitionLog. Can still use from django_fsm_log.models",
+    ),
+    ImportMapping(
+        old_module="django_fsm_log.decorators",
+        old_name="fsm_log_by",
+        new_module="django_fsm_rx.log",
+        new_name="fsm_log_by",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm_log.decorators",
+        old_name="fsm_log_description",
+        new_module="django_fsm_rx.log",
+        new_name="fsm_log_description",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm_log",
+        old_name="fsm_log_by",
+        new_module="django_fsm_rx.log",
+        new_name="fsm_log_by",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm_log",
+        old_name="fsm_log_description",
+        new_module="django_fsm_rx.log",
+        new_name="fsm_log_description",
+        notes="Direct replacement, API identical",
+    ),
     # Signal imports
-    {
-        "old_module": "django_fsm.signals",
-        "old_name": "pre_transition",
-        "new_module": "django_fsm_rx.signals",
-        "new_name": "pre_transition",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm.signals",
-        "old_name": "post_transition",
-        "new_module": "django_fsm_rx.signals",
-        "new_name": "post_transition",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm_2.signals",
-        "old_name": "pre_transition",
-        "new_module": "django_fsm_rx.signals",
-        "new_name": "pre_transition",
-        "notes": "Direct replacement, API identical",
-    },
-    {
-        "old_module": "django_fsm_2.signals",
-        "old_name": "post_transition",
-        "new_module": "django_fsm_rx.signals",
-        "new_name": "post_transition",
-        "notes": "Direct replacement, API identical",
-    },
+    ImportMapping(
+        old_module="django_fsm.signals",
+        old_name="pre_transition",
+        new_module="django_fsm_rx.signals",
+        new_name="pre_transition",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm.signals",
+        old_name="post_transition",
+        new_module="django_fsm_rx.signals",
+        new_name="post_transition",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm_2.signals",
+        old_name="pre_transition",
+        new_module="django_fsm_rx.signals",
+        new_name="pre_transition",
+        notes="Direct replacement, API identical",
+    ),
+    ImportMapping(
+        old_module="django_fsm_2.signals",
+        old_name="post_transition",
+        new_module="django_fsm_rx.signals",
+        new_name="post_transition",
+        notes="Direct replacement, API identical",
+    ),
 ]
 
 
+# IMPORT_MAPPINGS grouped by old module, built once so scanning can look up an import in O(1)
+_BY_MODULE: dict[str, list[ImportMapping]] = {}
+for _mapping in IMPORT_MAPPINGS:
+    _BY_MODULE.setdefault(_mapping.old_module, []).append(_mapping)
+del _mapping
+
+# Matches any deprecated top-level package name (but not django_fsm_rx), so files that can't
+# contain a deprecated import are skipped without being parsed
+_DEPRECATED_PACKAGES = sorted({module.split(".")[0] for module in _BY_MODULE})
+_DEPRECATED_PACKAGE_ALTERNATION = b"|".join(re.escape(name.encode()) for name in _DEPRECATED_PACKAGES)
+_DEPRECATED_MODULE_RE = re.compile(rb"\b(?:" + _DEPRECATED_PACKAGE_ALTERNATION + rb")\b")
+
+
+@dataclass(slots=True)
 class MigrationReport:
     """
     Report of migration status and required changes.
@@ -319,17 +374,20 @@ class MigrationReport:
     Attributes:
         deprecated_imports: List of deprecated import statements found.
         suggested_changes: Dictionary mapping old imports to suggested replacements.
-        files_affected: List of file paths that need updating.
+        files_affected: Set of file paths that need updating.
         warnings: List of warning messages.
         is_fully_migrated: Boolean indicating if migration is complete.
     """
 
-    def __init__(self) -> None:
-        self.deprecated_imports: list[dict[str, Any]] = []
-        self.suggested_changes: dict[str, str] = {}
-        self.files_affected: list[str] = []
-        self.warnings: list[str] = []
-        self.is_fully_migrated: bool = True
+    deprecated_imports: list[dict[str, Any]] = field(default_factory=list)
+    suggested_changes: dict[str, str] = field(default_factory=dict)
+    files_affected: set[str] = field(default_factory=set)
+    warnings: list[str] = field(default_factory=list)
+
+    @property
+    def is_fully_migrated(self) -> bool:
+        """Whether no deprecated imports were found; warnings don't block migration."""
+        return not self.deprecated_imports
 
     def add_deprecated_import(
         self,
@@ -350,14 +408,19 @@ class MigrationReport:
             }
         )
         self.suggested_changes[old_import] = new_import
-        if file_path not in self.files_affected:
-            self.files_affected.append(file_path)
-        self.is_fully_migrated = False
+        self.files_affected.add(file_path)
 
     def add_warning(self, message: str) -> None:
         """Add a warning message to the report."""
         self.warnings.append(message)
 
+    def merge(self, other: MigrationReport) -> None:
+        """Add all findings and warnings from another report to this one."""
+        self.deprecated_imports.extend(other.deprecated_imports)
+        self.suggested_changes.update(other.suggested_changes)
+        self.files_affected.update(other.files_affected)
+        self.warnings.extend(other.warnings)
+
     def __str__(self) -> str:
         """Generate a human-readable report."""
         lines = ["=" * 60, "Django FSM-RX Migration Report", "=" * 60, ""]
@@ -389,24 +452,94 @@ class MigrationReport:
         return "\n".join(lines)
 
 
-def get_import_replacements() -> dict[str, str]:
+def _build_replacements() -> dict[str, str]:
+    return {
+        f"from {mapping.old_module} import {mapping.old_name}": f"from {mapping.new_module} import {mapping.new_name}"
+        for mapping in IMPORT_MAPPINGS
+    }
+
+
+# Old import statement -> new import statement, built once from IMPORT_MAPPINGS
+IMPORT_REPLACEMENTS: Final[Mapping[str, str]] = MappingProxyType(_build_replacements())
+
+
+def get_import_replacements() -> Mapping[str, str]:
     """
-    Get a dictionary mapping old import statements to new ones.
+    Get a read-only mapping of old import statements to new ones.
 
     Returns:
-        Dictionary mapping old import patterns to new import statements.
+        The shared ``IMPORT_REPLACEMENTS`` mapping of old import patterns to new import statements.
 
     Example:
         >>> replacements = get_import_replacements()
         >>> print(replacements['from django_fsm import FSMField'])
         'from django_fsm_rx import FSMField'
     """
-    replacements = {}
-    for mapping in IMPORT_MAPPINGS:
-        old = f"from {mapping['old_module']} import {mapping['old_name']}"
-        new = f"from {mapping['new_module']} import {mapping['new_name']}"
-        replacements[old] = new
-    return replacements
+    return IMPORT_REPLACEMENTS
+
+
+# Below this many files, starting worker processes costs more than scanning serially
+_PARALLEL_MIN_FILES = 200
+
+
+# Node types whose children can include statements (try/except handlers and match cases aren't ast.stmt)
+_STATEMENT_CONTAINERS = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+class _ImportScanner(ast.NodeVisitor):
+    """
+    Yield deprecated ``import``/``from ... import`` statements of a parsed module.
+
+    Every visit method is a generator, so callers can stop at the first finding
+    without walking the rest of the tree.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+
+    def generic_visit(self, node: ast.AST) -> Iterator[dict[str, Any]]:
+        # Imports are always statements, so expressions are never descended into
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, _STATEMENT_CONTAINERS):
+                yield from self.visit(child)
+
+    def visit_Import(self, node: ast.Import) -> Iterator[dict[str, Any]]:
+        for alias in node.names:
+            mappings = _BY_MODULE.get(alias.name)
+            if mappings:
+                yield self._finding(node, f"import {alias.name}", f"import {mappings[0].new_module}")
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> Iterator[dict[str, Any]]:
+        # Relative imports can't refer to the deprecated top-level packages
+        if node.level or node.module is None:
+            return
+        mappings = _BY_MODULE.get(node.module)
+        if not mappings:
+            return
+        imported_names = {alias.name for alias in node.names}
+        for mapping in mappings:
+            if mapping.old_name in imported_names:
+                old_import = f"from {mapping.old_module} import {mapping.old_name}"
+                yield self._finding(node, old_import, IMPORT_REPLACEMENTS[old_import], mapping.notes)
+
+    def _finding(self, node: ast.stmt, old_import: str, new_import: str, notes: str = "") -> dict[str, Any]:
+        return {"file": self.file_path, "line": node.lineno, "old": old_import, "new": new_import, "notes": notes}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_file(path: str, mtime_ns: int, size: int) -> ast.Module | None:
+    """
+    Parse a Python file into an AST, or return None if it never mentions a deprecated package.
+
+    The modification time and size are part of the cache key, so repeated scans
+    of an unchanged file reuse the result while edited files are re-read.
+    Use ``_parse_file.cache_clear()`` to drop all cached trees.
+    """
+    with open(path, "rb") as f:
+        source = f.read()
+    if not _DEPRECATED_MODULE_RE.search(source):
+        return None
+    return ast.parse(source, filename=path)
 
 
 def scan_imports_in_file(file_path: str | Path, report: MigrationReport | None = None) -> MigrationReport:
@@ -435,63 +568,131 @@ def scan_imports_in_file(file_path: str | Path, report: MigrationReport | None =
     if not file_path.suffix == ".py":
         return report
 
+    _extend_report(report, *_scan_file_findings(file_path))
+    return report
+
+
+def _scan_file_findings(file_path: str | Path) -> tuple[list[dict[str, Any]], list[str]]:
+    """Scan one Python file and return its findings and warnings as plain lists."""
     try:
-        content = file_path.read_text(encoding="utf-8")
+        return list(iter_deprecated_imports(file_path)), []
+    except (SyntaxError, ValueError) as e:
+        # Python 2 or newer-than-interpreter syntax: still report the imports we can see
+        warning = f"Could not parse {file_path}, used a line-based scan instead: {e}"
+        try:
+            return _scan_lines(file_path), [warning]
+        except OSError as read_error:
+            return [], [f"Could not read {file_path}: {read_error}"]
     except Exception as e:
-        report.add_warning(f"Could not read {file_path}: {e}")
-        return report
+        return [], [f"Could not read {file_path}: {e}"]
+
+
+# Line-based fallback for files ast.parse rejects; only single-line import statements are recognised
+_FROM_IMPORT_LINE_RE = re.compile(r"^\s*from\s+([\w.]+)\s+import\s+(.+)$")
+_IMPORT_LINE_RE = re.compile(r"^\s*import\s+(.+)$")
+_IMPORTED_NAME_RE = re.compile(r"\w+")
+
+
+def _scan_lines(file_path: str | Path) -> list[dict[str, Any]]:
+    """Find deprecated imports line by line, for files that can't be parsed."""
+    file_path = str(file_path)
+    with open(file_path, encoding="utf-8", errors="replace") as f:
+        lines = f.read().splitlines()
+
+    findings = []
+    for line_number, line in enumerate(lines, start=1):
+        from_match = _FROM_IMPORT_LINE_RE.match(line)
+        if from_match:
+            mappings = _BY_MODULE.get(from_match.group(1), ())
+            imported_names = set(_IMPORTED_NAME_RE.findall(from_match.group(2).split("#", 1)[0]))
+            for mapping in mappings:
+                if mapping.old_name in imported_names:
+                    old_import = f"from {mapping.old_module} import {mapping.old_name}"
+                    findings.append(
+                        _line_finding(file_path, line_number, old_import, IMPORT_REPLACEMENTS[old_import], mapping.notes)
+                    )
+            continue
+        import_match = _IMPORT_LINE_RE.match(line)
+        if import_match:
+            for alias in import_match.group(1).split("#", 1)[0].split(","):
+                module = alias.strip().split(" ", 1)[0]
+                mappings = _BY_MODULE.get(module)
+                if mappings:
+                    findings.append(_line_finding(file_path, line_number, f"import {module}", f"import {mappings[0].new_module}"))
+    return findings
 
-    lines = content.split("\n")
 
-    # Build regex patterns for each deprecated module
-    deprecated_patterns = {
-        "django_fsm": r"from\s+django_fsm\s+import\s+",
-        "django_fsm_2": r"from\s+django_fsm_2\s+import\s+",
-        "django_fsm.signals": r"from\s+django_fsm\.signals\s+import\s+",
-        "django_fsm_2.signals": r"from\s+django_fsm_2\.signals\s+import\s+",
-        "django_fsm_admin": r"from\s+django_fsm_admin(?:\.mixins)?\s+import\s+",
-        "django_fsm_log": r"from\s+django_fsm_log(?:\.(?:models|decorators))?\s+import\s+",
-    }
+def _line_finding(file_path: str, line_number: int, old_import: str, new_import: str, notes: str = "") -> dict[str, Any]:
+    return {"file": file_path, "line": line_number, "old": old_import, "new": new_import, "notes": notes}
 
-    for line_num, line in enumerate(lines, start=1):
-        stripped = line.strip()
 
-        # Skip comments and empty lines
-        if not stripped or stripped.startswith("#"):
-            continue
+def _extend_report(report: MigrationReport, findings: list[dict[str, Any]], file_warnings: list[str]) -> None:
+    """Add a batch of findings and warnings to a report with one extend per list."""
+    if findings:
+        report.deprecated_imports.extend(findings)
+        report.suggested_changes.update((item["old"], item["new"]) for item in findings)
+        report.files_affected.update(item["file"] for item in findings)
+    report.warnings.extend(file_warnings)
 
-        for module_key, pattern in deprecated_patterns.items():
-            if re.match(pattern, stripped):
-                # Find matching import mapping
-                for mapping in IMPORT_MAPPINGS:
-                    if mapping["old_module"].startswith(module_key.replace(".", r"\.")):
-                        if mapping["old_name"] in stripped:
-                            old_import = f"from {mapping['old_module']} import {mapping['old_name']}"
-                            new_import = f"from {mapping['new_module']} import {mapping['new_name']}"
-                            report.add_deprecated_import(
-                                str(file_path),
-                                line_num,
-                                old_import,
-                                new_import,
-                                mapping["notes"],
-                            )
-                            break
 
-    return report
+def iter_deprecated_imports(file_path: str | Path) -> Iterator[dict[str, Any]]:
+    """
+    Lazily yield the deprecated django-fsm imports in a Python file.
+
+    Each item has the same keys as the entries of ``MigrationReport.deprecated_imports``.
+    Unlike ``scan_imports_in_file``, read and parse errors are raised rather than
+    recorded as warnings.
+
+    Args:
+        file_path: Path to the Python file to scan.
+
+    Yields:
+        One dictionary per deprecated import, in source order.
+    """
+    file_path = Path(file_path)
+    stat = file_path.stat()
+    tree = _parse_file(str(file_path), stat.st_mtime_ns, stat.st_size)
+    if tree is not None:
+        # Only real import statements are visited, so comments and strings are skipped for free
+        yield from _ImportScanner(str(file_path)).visit(tree)
+
+
+def is_file_migrated(file_path: str | Path) -> bool:
+    """
+    Check whether a Python file is free of deprecated django-fsm imports.
+
+    Stops at the first deprecated import instead of collecting all of them.
+
+    Args:
+        file_path: Path to the Python file to check.
+
+    Returns:
+        True if the file has no deprecated imports.
+    """
+    return next(iter_deprecated_imports(file_path), None) is None
 
 
 def scan_imports_in_directory(
     directory: str | Path,
     exclude_patterns: list[str] | None = None,
     report: MigrationReport | None = None,
+    parallel: bool = False,
 ) -> MigrationReport:
     """
     Scan a directory recursively for deprecated django-fsm imports.
 
+    With ``parallel=True``, large trees are scanned in a pool of worker processes,
+    since parsing is CPU-bound and each file is independent. This is opt-in: under
+    the spawn and forkserver start methods the calling script's main module must be
+    import-safe (guarded by ``if __name__ == "__main__":``), and workers don't share
+    the parsed-file cache of the calling process.
+
     Args:
         directory: Path to the directory to scan.
         exclude_patterns: List of patterns to exclude (e.g., ['migrations', '__pycache__']).
         report: Optional existing report to add findings to.
+        parallel: Scan files in worker processes when there are enough of them
+            to outweigh the pool startup cost. Defaults to False.
 
     Returns:
         MigrationReport with findings from all files.
@@ -511,11 +712,31 @@ def scan_imports_in_directory(
         report.add_warning(f"Directory not found: {directory}")
         return report
 
-    for file_path in directory.rglob("*.py"):
-        # Check if any exclude pattern is in the path
-        if any(pattern in str(file_path) for pattern in exclude_patterns):
-            continue
-        scan_imports_in_file(file_path, report)
+    file_paths = []
+    for dirpath, dirnames, filenames in os.walk(directory):
+        relative_dir = os.path.relpath(dirpath, directory)
+        if relative_dir == os.curdir:
+            relative_dir = ""
+        # Prune excluded directories in place so the walk never descends into them
+        dirnames[:] = [
+            name for name in dirnames if not any(pattern in os.path.join(relative_dir, name) for pattern in exclude_patterns)
+        ]
+        for name in filenames:
+            if not name.endswith(".py"):
+                continue
+            # Check if any exclude pattern is in the path (relative to the scanned directory)
+            if any(pattern in os.path.join(relative_dir, name) for pattern in exclude_patterns):
+                continue
+            file_paths.append(os.path.join(dirpath, name))
+
+    # Workers hand back plain (findings, warnings) tuples, which are cheaper to pickle than reports
+    if parallel and len(file_paths) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            for findings, file_warnings in executor.map(_scan_file_findings, file_paths, chunksize=64):
+                _extend_report(report, findings, file_warnings)
+    else:
+        for file_path in file_paths:
+            _extend_report(report, *_scan_file_findings(file_path))
 
     return report
 
@@ -551,10 +772,16 @@ def check_migration_status() -> MigrationReport:
     return scan_imports_in_directory(Path.cwd(), report=report)
 
 
+# Validation warnings per model class; weak keys let dynamically created models be collected
+_VALIDATION_CACHE: WeakKeyDictionary[type[Model], tuple[str, ...]] = WeakKeyDictionary()
+
+
 def validate_model_fsm_compatibility(model_class: type[Model]) -> list[str]:
     """
     Validate that a model's FSM setup is compatible with django_fsm_rx.
 
+    Results are cached per model class and dropped when the class is garbage collected.
+
     This function checks for common migration issues:
     - FSM fields are properly configured
     - Transitions are properly decorated
@@ -572,6 +799,14 @@ def validate_model_fsm_compatibility(model_class: type[Model]) -> list[str]:
         >>> for warning in warnings:
         ...     print(warning)
     """
+    cached = _VALIDATION_CACHE.get(model_class)
+    if cached is None:
+        cached = _VALIDATION_CACHE[model_class] = tuple(_validate_model_fsm_compatibility(model_class))
+    # Hand out a fresh list so callers can't modify the cached result
+    return list(cached)
+
+
+def _validate_model_fsm_compatibility(model_class: type[Model]) -> list[str]:
     from django_fsm_rx import FSMFieldMixin
 
     validation_warnings: list[str] = []
@@ -584,16 +819,16 @@ def validate_model_fsm_compatibility(model_class: type[Model]) -> list[str]:
         return validation_warnings
 
     # Check each FSM field
-    for field in fsm_fields:
-        field_name = field.name
+    for fsm_field in fsm_fields:
+        field_name = fsm_field.name
 
         # Check for transitions
-        if model_class not in field.transitions or not field.transitions[model_class]:
+        if model_class not in fsm_field.transitions or not fsm_field.transitions[model_class]:
             validation_warnings.append(f"FSM field '{field_name}' has no transitions defined")
             continue
 
         # Check transition methods
-        for method_name, method in field.transitions[model_class].items():
+        for method_name, method in fsm_field.transitions[model_class].items():
             if not hasattr(method, "_django_fsm_rx"):
                 validation_warnings.append(
                     f"Transition method '{method_name}' missing _django_fsm_rx metadata. "
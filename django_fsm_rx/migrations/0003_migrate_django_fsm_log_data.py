@@ -3,13 +3,43 @@ from __future__ import annotations
 
 from django.db import migrations
 
-
-def migrate_statelog_data(apps, schema_editor):
+# Migrate data - use INSERT ... SELECT with conflict handling, one id window at a time
+# We use a subquery to avoid duplicates based on key fields
+_MIGRATE_SQL_TEMPLATE = """
+    INSERT INTO django_fsm_rx_fsmtransitionlog
+        (content_type_id, object_id, transition_name, source_state, target_state, timestamp, by_id, description)
+    SELECT
+        content_type_id,
+        {object_id_cast},
+        transition,
+        COALESCE(source_state, ''),
+        state,
+        timestamp,
+        by_id,
+        COALESCE(description, '')
+    FROM django_fsm_log_statelog old
+    WHERE old.id >= %s AND old.id < %s
+    AND NOT EXISTS (
+        SELECT 1 FROM django_fsm_rx_fsmtransitionlog new
+        WHERE new.content_type_id = old.content_type_id
+        AND new.object_id = {object_id_cast}
+        AND new.timestamp = old.timestamp
+        AND new.transition_name = old.transition
+    )
+"""
+# Qualify object_id with the outer alias; a bare name inside NOT EXISTS would resolve to new.object_id
+_MIGRATE_SQL = _MIGRATE_SQL_TEMPLATE.format(object_id_cast="CAST(old.object_id AS TEXT)")
+_MIGRATE_SQL_POSTGRESQL = _MIGRATE_SQL_TEMPLATE.format(object_id_cast="old.object_id::text")
+
+
+def migrate_statelog_data(apps, schema_editor, chunk_size=10000):
     """
     Copy data from django_fsm_log_statelog to django_fsm_rx_fsmtransitionlog.
 
     This migration is safe to run multiple times - it only copies records
     that don't already exist in the new table (based on timestamp + object_id + transition).
+    Rows are copied in id windows of ``chunk_size`` so large tables aren't
+    copied in one statement. Returns the number of rows copied.
     """
     connection = schema_editor.connection
 
@@ -18,53 +48,24 @@ def migrate_statelog_data(apps, schema_editor):
 
     if "django_fsm_log_statelog" not in table_names:
         # Old table doesn't exist, nothing to migrate
-        return
+        return 0
 
     with connection.cursor() as cursor:
-        # Check if there's any data to migrate
-        cursor.execute("SELECT COUNT(*) FROM django_fsm_log_statelog")
-        count = cursor.fetchone()[0]
-
-        if count == 0:
-            return
-
-        # Determine database backend for type casting
-        vendor = connection.vendor
-
-        if vendor == "postgresql":
-            # PostgreSQL: use ::text for casting
-            object_id_cast = "object_id::text"
-        else:
-            # SQLite, MySQL, etc: CAST function
-            object_id_cast = "CAST(object_id AS TEXT)"
-
-        # Migrate data - use INSERT ... SELECT with conflict handling
-        # We use a subquery to avoid duplicates based on key fields
-        cursor.execute(f"""
-            INSERT INTO django_fsm_rx_fsmtransitionlog
-                (content_type_id, object_id, transition_name, source_state, target_state, timestamp, by_id, description)
-            SELECT
-                content_type_id,
-                {object_id_cast},
-                transition,
-                COALESCE(source_state, ''),
-                state,
-                timestamp,
-                by_id,
-                COALESCE(description, '')
-            FROM django_fsm_log_statelog old
-            WHERE NOT EXISTS (
-                SELECT 1 FROM django_fsm_rx_fsmtransitionlog new
-                WHERE new.content_type_id = old.content_type_id
-                AND new.object_id = {object_id_cast}
-                AND new.timestamp = old.timestamp
-                AND new.transition_name = old.transition
-            )
-        """)
-
-        migrated = cursor.rowcount
+        # Find the id range to walk; both are NULL when there's no data to migrate
+        cursor.execute("SELECT MIN(id), MAX(id) FROM django_fsm_log_statelog")
+        min_id, max_id = cursor.fetchone()
+        if min_id is None:
+            return 0
+
+        # PostgreSQL casts with ::text; SQLite, MySQL, etc. use the CAST function
+        sql = _MIGRATE_SQL_POSTGRESQL if connection.vendor == "postgresql" else _MIGRATE_SQL
+        migrated = 0
+        for lo in range(min_id, max_id + 1, chunk_size):
+            cursor.execute(sql, [lo, lo + chunk_size])
+            migrated += cursor.rowcount
         if migrated > 0:
             print(f"  Migrated {migrated} records from django_fsm_log_statelog to django_fsm_rx_fsmtransitionlog")
+        return migrated
 
 
 def reverse_migration(apps, schema_editor):
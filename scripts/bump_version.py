@@ -27,19 +27,64 @@ import subprocess
 import sys
 from datetime import date
 from pathlib import Path
+from typing import Protocol
+
+_CHANGELOG_TITLE_RE = re.compile(r"Changelog\n=+\n\n")
+
+
+def _parse_version(version: str) -> tuple[int, int, int]:
+    """Parse an X.Y.Z version string into its integer components.
+
+    Raises ValueError naming the offending component.
+    """
+    parts = version.split(".")
+    if len(parts) != 3:
+        raise ValueError(f"expected 3 components, got {len(parts)}")
+    for part in parts:
+        # isascii() rejects non-ASCII digits that isdigit() would accept
+        if not (part.isascii() and part.isdigit()):
+            raise ValueError(f"component {part!r} is not a number")
+        if len(part) > 1 and part.startswith("0"):
+            raise ValueError(f"component {part!r} has a leading zero")
+    major, minor, patch = (int(part) for part in parts)
+    return major, minor, patch
+
+
+class FileSystem(Protocol):
+    """File access VersionBumper needs; LocalFS and test doubles implement it."""
+
+    def read_text(self, path: Path) -> str: ...
+
+    def write_text(self, path: Path, content: str) -> None: ...
+
+    def exists(self, path: Path) -> bool: ...
+
+
+class LocalFS:
+    """Read and write project files on the real filesystem."""
+
+    def read_text(self, path: Path) -> str:
+        return path.read_text()
+
+    def write_text(self, path: Path, content: str) -> None:
+        path.write_text(content)
+
+    def exists(self, path: Path) -> bool:
+        return path.exists()
 
 
 class VersionBumper:
     """Handle version bumping and release tasks."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, fs: FileSystem | None = None):
         self.project_root = project_root
+        self.fs = fs if fs is not None else LocalFS()
         self.pyproject_path = project_root / "pyproject.toml"
         self.changelog_path = project_root / "CHANGELOG.rst"
 
     def get_current_version(self) -> str:
         """Get current version from pyproject.toml."""
-        content = self.pyproject_path.read_text()
+        content = self.fs.read_text(self.pyproject_path)
         match = re.search(r'^version\s*=\s*"([^"]+)"', content, re.MULTILINE)
         if not match:
             raise ValueError("Could not find version in pyproject.toml")
@@ -47,7 +92,7 @@ class VersionBumper:
 
     def update_pyproject_version(self, new_version: str) -> None:
         """Update version in pyproject.toml."""
-        content = self.pyproject_path.read_text()
+        content = self.fs.read_text(self.pyproject_path)
         new_content = re.sub(
             r'^(version\s*=\s*)"[^"]+"',
             f'\\1"{new_version}"',
@@ -55,37 +100,35 @@ class VersionBumper:
             count=1,
             flags=re.MULTILINE,
         )
-        self.pyproject_path.write_text(new_content)
+        self.fs.write_text(self.pyproject_path, new_content)
 
     def update_changelog(self, version: str, messages: list[str]) -> None:
         """Add entry to CHANGELOG.rst."""
-        if not self.changelog_path.exists():
+        if not self.fs.exists(self.changelog_path):
             print("  Warning: CHANGELOG.rst not found, skipping")
             return
 
-        content = self.changelog_path.read_text()
+        content = self.fs.read_text(self.changelog_path)
         today = date.today().strftime("%Y-%m-%d")
 
-        # Build the new entry
+        # Build the new entry in one join rather than nested interpolation
         header = f"django-fsm-rx {version} {today}"
-        underline = "~" * len(header)
-        entries = "\n".join(f"- {msg}" for msg in messages)
-        new_entry = f"{header}\n{underline}\n\n{entries}\n\n\n"
-
-        # Insert after the main title
-        pattern = r"(Changelog\n=+\n\n)"
-        if re.search(pattern, content):
-            new_content = re.sub(pattern, f"\\1{new_entry}", content, count=1)
+        new_entry = "".join([header, "\n", "~" * len(header), "\n\n", *(f"- {msg}\n" for msg in messages), "\n\n"])
+
+        # Insert after the main title; slicing avoids re.sub escaping the entry text
+        match = _CHANGELOG_TITLE_RE.search(content)
+        if match:
+            new_content = "".join([content[: match.end()], new_entry, content[match.end() :]])
         else:
-            new_content = f"Changelog\n=========\n\n{new_entry}{content}"
+            new_content = "".join(["Changelog\n=========\n\n", new_entry, content])
 
-        self.changelog_path.write_text(new_content)
+        self.fs.write_text(self.changelog_path, new_content)
 
     def git_commit(self, version: str, messages: list[str]) -> None:
         """Create git commit with version changes."""
         # Stage changes
         files_to_add = ["pyproject.toml"]
-        if self.changelog_path.exists():
+        if self.fs.exists(self.changelog_path):
             files_to_add.append("CHANGELOG.rst")
 
         subprocess.run(
@@ -164,7 +207,8 @@ def find_project_root() -> Path | None:
     return None
 
 
-def main() -> int:
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Bump version, update changelog, commit, and tag",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -209,12 +253,17 @@ Examples:
         default="main",
         help="Branch to push (default: main)",
     )
+    return parser
+
 
-    args = parser.parse_args()
+def main(argv: list[str] | None = None) -> int:
+    args = build_arg_parser().parse_args(argv)
 
     # Validate version format
-    if not re.match(r"^\d+\.\d+\.\d+$", args.version):
-        print(f"Error: Invalid version format: {args.version}. Expected: X.Y.Z")
+    try:
+        _parse_version(args.version)
+    except ValueError as e:
+        print(f"Error: Invalid version format: {args.version} ({e}). Expected: X.Y.Z")
         return 1
 
     # Find project root
@@ -22,18 +22,13 @@ from django.test import override_settings
 from django_fsm_rx import FSMField
 from django_fsm_rx import transition
 from django_fsm_rx.conf import FSMRXSettings
-from django_fsm_rx.conf import fsm_rx_settings
 
 
 @contextmanager
 def override_fsm_settings(**kwargs):
-    """Context manager that overrides Django settings and clears the FSM settings cache."""
+    """Context manager that overrides DJANGO_FSM_RX; the settings cache is cleared on change."""
     with override_settings(DJANGO_FSM_RX=kwargs):
-        fsm_rx_settings.clear_cache()
-        try:
-            yield
-        finally:
-            fsm_rx_settings.clear_cache()
+        yield
 
 
 # =============================================================================
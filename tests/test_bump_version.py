@@ -12,15 +12,82 @@ These tests verify:
 
 from __future__ import annotations
 
-import re
+import importlib.util
+import shutil
 import subprocess
-import tempfile
+import sys
+from collections.abc import Iterable
 from pathlib import Path
 
 import pytest
 from django.core.management import call_command
 from django.core.management.base import CommandError
 
+_PYPROJECT_BYTES = b'[project]\nname = "test"\nversion = "1.0.0"\n'
+_CHANGELOG_BYTES = b"Changelog\n=========\n\n"
+
+_GIT_INIT_SCRIPT = (
+    "git init -q && git config user.email test@test.com && git config user.name Test"
+    " && git add . && git commit -q -m Initial --allow-empty"
+)
+
+
+def _init_repo(path: Path) -> None:
+    """Initialize and commit a git repository at ``path`` in a single process."""
+    shell = ["cmd", "/c"] if sys.platform == "win32" else ["bash", "-c"]
+    subprocess.run([*shell, _GIT_INIT_SCRIPT], cwd=path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def _assert_all_in(haystack: str, needles: Iterable[str]) -> None:
+    """Assert every needle occurs in haystack, reporting all missing ones at once."""
+    missing = [needle for needle in needles if needle not in haystack]
+    assert not missing, f"Missing from output: {missing}"
+
+
+class FakeFS:
+    """In-memory stand-in for VersionBumper's filesystem access."""
+
+    def __init__(self, files: dict[Path, str] | None = None):
+        self.files = dict(files or {})
+
+    def read_text(self, path: Path) -> str:
+        return self.files[path]
+
+    def write_text(self, path: Path, content: str) -> None:
+        self.files[path] = content
+
+    def exists(self, path: Path) -> bool:
+        return path in self.files
+
+
+@pytest.fixture(scope="session")
+def bump_version_module():
+    """Load scripts/bump_version.py once for the whole session."""
+    script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
+    spec = importlib.util.spec_from_file_location("bump_version", script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def git_template_repo(tmp_path_factory):
+    """Build one committed git repository to be copied by each test that needs one."""
+    template = tmp_path_factory.mktemp("git_template")
+    (template / "pyproject.toml").write_bytes(_PYPROJECT_BYTES)
+    (template / "CHANGELOG.rst").write_bytes(_CHANGELOG_BYTES)
+
+    _init_repo(template)
+    return template
+
+
+@pytest.fixture
+def git_tmpdir(git_template_repo, tmp_path):
+    """Provide a fresh copy of the template git repository."""
+    repo = tmp_path / "repo"
+    shutil.copytree(git_template_repo, repo)
+    return repo
+
 
 class TestBumpVersionCommand:
     """Tests for bump_version management command."""
@@ -31,6 +98,12 @@ class TestBumpVersionCommand:
 
         assert Command is not None
 
+    def test_django_set_up_before_call_command(self):
+        """pytest-django configures settings and loads apps once per session."""
+        from django.apps import apps
+
+        assert apps.ready
+
     def test_invalid_version_format_raises_error(self):
         """Invalid version format should raise error."""
         with pytest.raises(CommandError) as exc_info:
@@ -38,35 +111,70 @@ class TestBumpVersionCommand:
 
         assert "Invalid version format" in str(exc_info.value)
 
-    def test_invalid_version_format_variations(self):
+    @pytest.mark.parametrize(
+        "version",
+        [
+            pytest.param("5.1", id="missing-patch"),
+            pytest.param("5", id="missing-minor-and-patch"),
+            pytest.param("v5.1.4", id="v-prefix"),
+            pytest.param("5.1.4.5", id="too-many-parts"),
+            pytest.param("5.1.a", id="non-numeric"),
+            pytest.param("five.one.four", id="words"),
+            pytest.param("5.01.4", id="leading-zero"),
+            pytest.param("5.1.\u0664", id="non-ascii-digit"),
+            pytest.param("", id="empty"),
+        ],
+    )
+    def test_invalid_version_format_variations(self, version):
         """Various invalid version formats should raise error."""
-        invalid_versions = [
-            "5.1",  # Missing patch
-            "5",  # Missing minor and patch
-            "v5.1.4",  # Has 'v' prefix
-            "5.1.4.5",  # Too many parts
-            "5.1.a",  # Non-numeric
-            "five.one.four",  # Words
-            "",  # Empty
-        ]
-
-        for version in invalid_versions:
-            with pytest.raises(CommandError) as exc_info:
-                call_command("bump_version", version, "-m", "Test")
-            assert "Invalid version format" in str(exc_info.value), f"Should reject: {version}"
-
-    def test_valid_version_formats(self):
-        """Valid version formats should pass regex validation."""
-        valid_versions = [
-            "5.1.4",
-            "0.0.1",
-            "10.20.30",
-            "1.0.0",
-        ]
-
-        pattern = r"^\d+\.\d+\.\d+$"
-        for version in valid_versions:
-            assert re.match(pattern, version), f"Should accept: {version}"
+        with pytest.raises(CommandError) as exc_info:
+            call_command("bump_version", version, "-m", "Test")
+        assert "Invalid version format" in str(exc_info.value)
+
+    @pytest.mark.parametrize("version", ["5.1.4", "0.0.1", "10.20.30", "1.0.0"])
+    def test_valid_version_formats(self, bump_version_module, version):
+        """Valid version formats should pass validation."""
+        assert bump_version_module._parse_version(version) == tuple(int(p) for p in version.split("."))
+
+    @pytest.mark.parametrize(
+        "version",
+        [
+            pytest.param("5.1", id="missing-patch"),
+            pytest.param("5.1.4.5", id="too-many-parts"),
+            pytest.param("5.1.a", id="non-numeric"),
+            pytest.param("5.01.4", id="leading-zero"),
+            pytest.param("5.1.\u0664", id="non-ascii-digit"),
+            pytest.param("", id="empty"),
+        ],
+    )
+    def test_parse_version_rejects_invalid(self, bump_version_module, version):
+        """The script's parser should reject malformed components."""
+        with pytest.raises(ValueError):
+            bump_version_module._parse_version(version)
+
+    @pytest.mark.parametrize("version", ["5.1.4", "0.0.1", "5.01.4", "5.1.\u0664", "5.1", ""])
+    def test_command_parser_matches_script(self, bump_version_module, version):
+        """The command and the script should accept and reject the same versions."""
+        from django_fsm_rx.management.commands.bump_version import _parse_version
+
+        try:
+            expected = bump_version_module._parse_version(version)
+        except ValueError:
+            with pytest.raises(ValueError):
+                _parse_version(version)
+        else:
+            assert _parse_version(version) == expected
+
+    def test_command_update_changelog_preserves_backslashes(self, tmp_path):
+        """The command should insert messages verbatim, without regex escape processing."""
+        from django_fsm_rx.management.commands.bump_version import Command
+
+        changelog = tmp_path / "CHANGELOG.rst"
+        changelog.write_text("Changelog\n=========\n\n1.0.0 (2024-01-01)\n")
+
+        Command()._update_changelog(changelog, "1.1.0", [r"Fix C:\path\1 handling"])
+
+        assert r"- Fix C:\path\1 handling" in changelog.read_text()
 
     def test_missing_message_raises_error(self):
         """Missing changelog message should raise error (tested via script)."""
@@ -80,23 +188,21 @@ class TestBumpVersionCommand:
         assert result.returncode != 0
         assert "required" in result.stderr.lower() or "-m" in result.stderr
 
-    def test_same_version_raises_error(self):
+    def test_same_version_raises_error(self, tmp_path):
         """Setting same version should raise error."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-            pyproject = tmpdir / "pyproject.toml"
-            pyproject.write_text('[project]\nname = "test"\nversion = "1.0.0"\n')
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_bytes(_PYPROJECT_BYTES)
 
-            script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
-            result = subprocess.run(
-                ["python", str(script_path), "1.0.0", "-m", "Test"],
-                capture_output=True,
-                text=True,
-                cwd=tmpdir,
-            )
+        script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
+        result = subprocess.run(
+            ["python", str(script_path), "1.0.0", "-m", "Test"],
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+        )
 
-            assert result.returncode != 0
-            assert "already set" in result.stdout.lower()
+        assert result.returncode != 0
+        assert "already set" in result.stdout.lower()
 
 
 class TestBumpVersionScript:
@@ -115,436 +221,361 @@ class TestBumpVersionScript:
 
         py_compile.compile(str(script_path), doraise=True)
 
-    def test_script_help(self):
+    def test_script_help(self, bump_version_module):
         """Script should show help without errors."""
-        script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
-        result = subprocess.run(
-            ["python", str(script_path), "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-        assert "version" in result.stdout.lower()
-        assert "--message" in result.stdout or "-m" in result.stdout
+        help_text = bump_version_module.build_arg_parser().format_help()
+        assert "version" in help_text.lower()
+        assert "--message" in help_text
 
-    def test_script_invalid_version(self):
+    @pytest.mark.parametrize("version", ["invalid", "5.1", "v5.1.4"])
+    def test_script_invalid_version(self, version):
         """Script should reject invalid version format."""
         script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
         result = subprocess.run(
-            ["python", str(script_path), "invalid", "-m", "Test"],
+            ["python", str(script_path), version, "-m", "Test"],
             capture_output=True,
             text=True,
         )
         assert result.returncode != 0
         assert "invalid version format" in result.stdout.lower() or "invalid version format" in result.stderr.lower()
 
-    def test_script_missing_message(self):
+    def test_script_missing_message(self, bump_version_module, capsys):
         """Script should require -m message."""
-        script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
-        result = subprocess.run(
-            ["python", str(script_path), "1.0.0"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode != 0
-        assert "required" in result.stderr.lower() or "message" in result.stderr.lower()
+        parser = bump_version_module.build_arg_parser()
+        with pytest.raises(SystemExit):
+            parser.parse_args(["1.0.0"])
+        assert "required" in capsys.readouterr().err.lower()
 
 
 class TestVersionBumperClass:
     """Tests for VersionBumper class from the script."""
 
-    @pytest.fixture
-    def bumper(self, tmp_path):
-        """Create a VersionBumper instance with temp directory."""
-        # Import the class from the script
-        import importlib.util
+    PYPROJECT = '[project]\nname = "test-project"\nversion = "1.0.0"\n'
+    CHANGELOG = "Changelog\n=========\n\ntest-project 1.0.0 2025-01-01\n~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~\n\n- Initial release\n"
 
-        script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
-        spec = importlib.util.spec_from_file_location("bump_version", script_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-
-        # Create pyproject.toml
-        pyproject = tmp_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test-project"\nversion = "1.0.0"\n')
+    @pytest.fixture(scope="module")
+    def bumper_template(self, tmp_path_factory):
+        """Build the pyproject.toml/CHANGELOG.rst pair once for the module."""
+        template = tmp_path_factory.mktemp("bumper_template")
+        (template / "pyproject.toml").write_text(self.PYPROJECT)
+        (template / "CHANGELOG.rst").write_text(self.CHANGELOG)
+        return template
 
-        # Create CHANGELOG.rst
-        changelog = tmp_path / "CHANGELOG.rst"
-        changelog.write_text(
-            "Changelog\n=========\n\ntest-project 1.0.0 2025-01-01\n~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~\n\n- Initial release\n"
-        )
+    @pytest.fixture
+    def bumper(self, bump_version_module, bumper_template, tmp_path):
+        """Create a VersionBumper instance with temp directory."""
+        project_root = tmp_path / "project"
+        shutil.copytree(bumper_template, project_root)
+        return bump_version_module.VersionBumper(project_root)
 
-        return module.VersionBumper(tmp_path)
+    @pytest.fixture
+    def fake_bumper(self, bump_version_module):
+        """Create a VersionBumper whose files live in memory."""
+        root = Path("/project")
+        fs = FakeFS({root / "pyproject.toml": self.PYPROJECT, root / "CHANGELOG.rst": self.CHANGELOG})
+        return bump_version_module.VersionBumper(root, fs=fs)
 
     def test_get_current_version(self, bumper):
         """Should read current version from pyproject.toml."""
         version = bumper.get_current_version()
         assert version == "1.0.0"
 
-    def test_update_pyproject_version(self, bumper):
+    def test_update_pyproject_version(self, fake_bumper):
         """Should update version in pyproject.toml."""
-        bumper.update_pyproject_version("1.1.0")
+        fake_bumper.update_pyproject_version("1.1.0")
 
-        content = bumper.pyproject_path.read_text()
+        content = fake_bumper.fs.read_text(fake_bumper.pyproject_path)
         assert 'version = "1.1.0"' in content
         assert 'version = "1.0.0"' not in content
 
-    def test_update_pyproject_preserves_other_content(self, bumper):
+    def test_update_pyproject_preserves_other_content(self, fake_bumper):
         """Should preserve other content when updating version."""
         # Add more content to pyproject.toml
-        original = bumper.pyproject_path.read_text()
-        bumper.pyproject_path.write_text(original + '\n[tool.pytest]\ntestpaths = ["tests"]\n')
+        original = fake_bumper.fs.read_text(fake_bumper.pyproject_path)
+        fake_bumper.fs.write_text(fake_bumper.pyproject_path, original + '\n[tool.pytest]\ntestpaths = ["tests"]\n')
 
-        bumper.update_pyproject_version("2.0.0")
+        fake_bumper.update_pyproject_version("2.0.0")
 
-        content = bumper.pyproject_path.read_text()
+        content = fake_bumper.fs.read_text(fake_bumper.pyproject_path)
         assert 'version = "2.0.0"' in content
         assert 'name = "test-project"' in content
         assert 'testpaths = ["tests"]' in content
 
-    def test_update_changelog(self, bumper):
+    def test_update_changelog(self, fake_bumper):
         """Should add entry to CHANGELOG.rst."""
-        bumper.update_changelog("1.1.0", ["Add new feature", "Fix bug"])
+        fake_bumper.update_changelog("1.1.0", ["Add new feature", "Fix bug"])
 
-        content = bumper.changelog_path.read_text()
-        assert "django-fsm-rx 1.1.0" in content
-        assert "- Add new feature" in content
-        assert "- Fix bug" in content
+        content = fake_bumper.fs.read_text(fake_bumper.changelog_path)
+        _assert_all_in(content, ["django-fsm-rx 1.1.0", "- Add new feature", "- Fix bug"])
         # New entry should come before old entry
         assert content.index("1.1.0") < content.index("1.0.0")
 
-    def test_update_changelog_single_message(self, bumper):
+    def test_update_changelog_single_message(self, fake_bumper):
         """Should handle single changelog message."""
-        bumper.update_changelog("1.1.0", ["Single change"])
+        fake_bumper.update_changelog("1.1.0", ["Single change"])
 
-        content = bumper.changelog_path.read_text()
+        content = fake_bumper.fs.read_text(fake_bumper.changelog_path)
         assert "- Single change" in content
 
-    def test_update_changelog_creates_proper_rst_format(self, bumper):
-        """Should create proper RST format with underline."""
-        bumper.update_changelog("1.1.0", ["Test"])
+    def test_update_changelog_preserves_backslashes(self, fake_bumper):
+        """Messages should be inserted verbatim, without regex escape processing."""
+        fake_bumper.update_changelog("1.1.0", [r"Fix C:\path\1 handling"])
 
-        content = bumper.changelog_path.read_text()
-        lines = content.split("\n")
+        content = fake_bumper.fs.read_text(fake_bumper.changelog_path)
+        assert r"- Fix C:\path\1 handling" in content
+
+    def test_update_changelog_creates_proper_rst_format(self, fake_bumper):
+        """Should create proper RST format with underline."""
+        fake_bumper.update_changelog("1.1.0", ["Test"])
 
-        # Find the header line
-        header_idx = None
-        for i, line in enumerate(lines):
-            if "django-fsm-rx 1.1.0" in line:
-                header_idx = i
-                break
+        content = fake_bumper.fs.read_text(fake_bumper.changelog_path)
 
-        assert header_idx is not None
-        # Next line should be underline of same length
-        header = lines[header_idx]
-        underline = lines[header_idx + 1]
-        assert len(underline) == len(header)
-        assert all(c == "~" for c in underline)
+        # Locate the header line and the underline that follows it
+        idx = content.index("django-fsm-rx 1.1.0")
+        header_end = content.index("\n", idx)
+        underline_end = content.index("\n", header_end + 1)
+        header = content[idx:header_end]
+        underline = content[header_end + 1 : underline_end]
+        # A single string compare checks both the length and the characters
+        assert underline == "~" * len(header)
 
 
 class TestDryRunMode:
     """Tests for dry run mode."""
 
-    def test_dry_run_does_not_modify_files(self):
+    def test_dry_run_does_not_modify_files(self, tmp_path):
         """Dry run should not modify any files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            # Create files
-            pyproject = tmpdir / "pyproject.toml"
-            pyproject.write_text('[project]\nname = "test"\nversion = "1.0.0"\n')
+        # Create files
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_bytes(_PYPROJECT_BYTES)
 
-            changelog = tmpdir / "CHANGELOG.rst"
-            changelog.write_text("Changelog\n=========\n\n")
+        changelog = tmp_path / "CHANGELOG.rst"
+        changelog.write_bytes(_CHANGELOG_BYTES)
 
-            original_pyproject = pyproject.read_text()
-            original_changelog = changelog.read_text()
+        original_pyproject = pyproject.read_text()
+        original_changelog = changelog.read_text()
 
-            # Run script with --dry-run
-            script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
-            subprocess.run(
-                ["python", str(script_path), "1.1.0", "-m", "Test change", "--dry-run"],
-                capture_output=True,
-                text=True,
-                cwd=tmpdir,
-            )
+        # Run script with --dry-run
+        script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
+        subprocess.run(
+            ["python", str(script_path), "1.1.0", "-m", "Test change", "--dry-run"],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+        )
 
-            # Files should be unchanged
-            assert pyproject.read_text() == original_pyproject
-            assert changelog.read_text() == original_changelog
+        # Files should be unchanged
+        assert pyproject.read_text() == original_pyproject
+        assert changelog.read_text() == original_changelog
 
-    def test_dry_run_shows_what_would_happen(self):
+    def test_dry_run_shows_what_would_happen(self, tmp_path):
         """Dry run should show what would be done."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            pyproject = tmpdir / "pyproject.toml"
-            pyproject.write_text('[project]\nname = "test"\nversion = "1.0.0"\n')
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_bytes(_PYPROJECT_BYTES)
 
-            changelog = tmpdir / "CHANGELOG.rst"
-            changelog.write_text("Changelog\n=========\n\n")
+        changelog = tmp_path / "CHANGELOG.rst"
+        changelog.write_bytes(_CHANGELOG_BYTES)
 
-            script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
-            result = subprocess.run(
-                ["python", str(script_path), "1.1.0", "-m", "New feature", "--dry-run"],
-                capture_output=True,
-                text=True,
-                cwd=tmpdir,
-            )
+        script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
+        result = subprocess.run(
+            ["python", str(script_path), "1.1.0", "-m", "New feature", "--dry-run"],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+        )
 
-            output = result.stdout
-            assert "DRY RUN" in output
-            assert "Would update pyproject.toml" in output or "pyproject.toml" in output
-            assert "New feature" in output
+        output = result.stdout
+        _assert_all_in(output, ["DRY RUN", "Would update pyproject.toml", "New feature"])
 
 
 class TestNoCommitMode:
     """Tests for --no-commit mode."""
 
-    def test_no_commit_updates_files_only(self):
+    def test_no_commit_updates_files_only(self, git_tmpdir):
         """--no-commit should update files but not create git commit."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            # Initialize git repo
-            subprocess.run(["git", "init"], cwd=tmpdir, capture_output=True)
-            subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=tmpdir, capture_output=True)
-            subprocess.run(["git", "config", "user.name", "Test"], cwd=tmpdir, capture_output=True)
-
-            # Create files
-            pyproject = tmpdir / "pyproject.toml"
-            pyproject.write_text('[project]\nname = "test"\nversion = "1.0.0"\n')
-
-            changelog = tmpdir / "CHANGELOG.rst"
-            changelog.write_text("Changelog\n=========\n\n")
-
-            # Initial commit
-            subprocess.run(["git", "add", "."], cwd=tmpdir, capture_output=True)
-            subprocess.run(["git", "commit", "-m", "Initial"], cwd=tmpdir, capture_output=True)
-
-            # Run with --no-commit
-            script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
-            subprocess.run(
-                ["python", str(script_path), "1.1.0", "-m", "Test", "--no-commit"],
-                capture_output=True,
-                text=True,
-                cwd=tmpdir,
-            )
-
-            # Files should be updated
-            assert 'version = "1.1.0"' in pyproject.read_text()
-            assert "1.1.0" in changelog.read_text()
-
-            # But no new commit should exist
-            log_result = subprocess.run(
-                ["git", "log", "--oneline"],
-                cwd=tmpdir,
-                capture_output=True,
-                text=True,
-            )
-            assert "Release 1.1.0" not in log_result.stdout
-
-            # And no tag
-            tag_result = subprocess.run(
-                ["git", "tag", "-l"],
-                cwd=tmpdir,
-                capture_output=True,
-                text=True,
-            )
-            assert "1.1.0" not in tag_result.stdout
+        tmpdir = git_tmpdir
+        pyproject = tmpdir / "pyproject.toml"
+        changelog = tmpdir / "CHANGELOG.rst"
+
+        # Run with --no-commit
+        script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
+        subprocess.run(
+            ["python", str(script_path), "1.1.0", "-m", "Test", "--no-commit"],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=tmpdir,
+        )
+
+        # Files should be updated
+        assert 'version = "1.1.0"' in pyproject.read_text()
+        assert "1.1.0" in changelog.read_text()
+
+        # But no new commit should exist
+        log_result = subprocess.run(
+            ["git", "log", "--oneline"],
+            cwd=tmpdir,
+            capture_output=True,
+            text=True,
+        )
+        assert "Release 1.1.0" not in log_result.stdout
+
+        # And no tag
+        tag_result = subprocess.run(
+            ["git", "tag", "-l"],
+            cwd=tmpdir,
+            capture_output=True,
+            text=True,
+        )
+        assert "1.1.0" not in tag_result.stdout
 
 
 class TestGitOperations:
     """Tests for git commit and tag operations."""
 
-    def test_creates_commit_and_tag(self):
+    def test_creates_commit_and_tag(self, git_tmpdir):
         """Should create git commit and tag."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            # Initialize git repo
-            subprocess.run(["git", "init"], cwd=tmpdir, capture_output=True)
-            subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=tmpdir, capture_output=True)
-            subprocess.run(["git", "config", "user.name", "Test"], cwd=tmpdir, capture_output=True)
-
-            # Create files
-            pyproject = tmpdir / "pyproject.toml"
-            pyproject.write_text('[project]\nname = "test"\nversion = "1.0.0"\n')
-
-            changelog = tmpdir / "CHANGELOG.rst"
-            changelog.write_text("Changelog\n=========\n\n")
-
-            # Initial commit
-            subprocess.run(["git", "add", "."], cwd=tmpdir, capture_output=True)
-            subprocess.run(["git", "commit", "-m", "Initial"], cwd=tmpdir, capture_output=True)
-
-            # Run bump_version
-            script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
-            result = subprocess.run(
-                ["python", str(script_path), "1.1.0", "-m", "Add feature X"],
-                capture_output=True,
-                text=True,
-                cwd=tmpdir,
-            )
-
-            assert result.returncode == 0, f"Script failed: {result.stdout}\n{result.stderr}"
-
-            # Check commit exists
-            log_result = subprocess.run(
-                ["git", "log", "--oneline", "-1"],
-                cwd=tmpdir,
-                capture_output=True,
-                text=True,
-            )
-            assert "Release 1.1.0" in log_result.stdout
-
-            # Check tag exists (without 'v' prefix)
-            tag_result = subprocess.run(
-                ["git", "tag", "-l"],
-                cwd=tmpdir,
-                capture_output=True,
-                text=True,
-            )
-            assert "1.1.0" in tag_result.stdout
-            assert "v1.1.0" not in tag_result.stdout  # Should NOT have 'v' prefix
-
-    def test_tag_has_no_v_prefix(self):
+        tmpdir = git_tmpdir
+
+        # Run bump_version
+        script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
+        result = subprocess.run(
+            ["python", str(script_path), "1.1.0", "-m", "Add feature X"],
+            capture_output=True,
+            text=True,
+            cwd=tmpdir,
+        )
+
+        assert result.returncode == 0, f"Script failed: {result.stdout}\n{result.stderr}"
+
+        # Check commit exists
+        log_result = subprocess.run(
+            ["git", "log", "--oneline", "-1"],
+            cwd=tmpdir,
+            capture_output=True,
+            text=True,
+        )
+        assert "Release 1.1.0" in log_result.stdout
+
+        # Check tag exists (without 'v' prefix)
+        tag_result = subprocess.run(
+            ["git", "tag", "-l"],
+            cwd=tmpdir,
+            capture_output=True,
+            text=True,
+        )
+        assert "1.1.0" in tag_result.stdout
+        assert "v1.1.0" not in tag_result.stdout  # Should NOT have 'v' prefix
+
+    def test_tag_has_no_v_prefix(self, git_tmpdir):
         """Tag should not have 'v' prefix."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            # Initialize git repo
-            subprocess.run(["git", "init"], cwd=tmpdir, capture_output=True)
-            subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=tmpdir, capture_output=True)
-            subprocess.run(["git", "config", "user.name", "Test"], cwd=tmpdir, capture_output=True)
-
-            pyproject = tmpdir / "pyproject.toml"
-            pyproject.write_text('[project]\nname = "test"\nversion = "1.0.0"\n')
-
-            subprocess.run(["git", "add", "."], cwd=tmpdir, capture_output=True)
-            subprocess.run(["git", "commit", "-m", "Initial"], cwd=tmpdir, capture_output=True)
-
-            script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
-            subprocess.run(
-                ["python", str(script_path), "2.0.0", "-m", "Major release", "--no-changelog"],
-                capture_output=True,
-                text=True,
-                cwd=tmpdir,
-            )
-
-            # Verify tag format
-            tag_result = subprocess.run(
-                ["git", "tag", "-l"],
-                cwd=tmpdir,
-                capture_output=True,
-                text=True,
-            )
-            tags = tag_result.stdout.strip().split("\n")
-            assert "2.0.0" in tags
-            assert "v2.0.0" not in tags
+        tmpdir = git_tmpdir
+
+        script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
+        subprocess.run(
+            ["python", str(script_path), "2.0.0", "-m", "Major release", "--no-changelog"],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=tmpdir,
+        )
+
+        # Verify tag format
+        tag_result = subprocess.run(
+            ["git", "tag", "-l"],
+            cwd=tmpdir,
+            capture_output=True,
+            text=True,
+        )
+        tags = tag_result.stdout.strip().split("\n")
+        assert "2.0.0" in tags
+        assert "v2.0.0" not in tags
 
 
 class TestMultipleMessages:
     """Tests for multiple changelog messages."""
 
-    def test_multiple_messages_in_changelog(self):
+    def test_multiple_messages_in_changelog(self, tmp_path):
         """Multiple -m flags should create multiple changelog entries."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            pyproject = tmpdir / "pyproject.toml"
-            pyproject.write_text('[project]\nname = "test"\nversion = "1.0.0"\n')
-
-            changelog = tmpdir / "CHANGELOG.rst"
-            changelog.write_text("Changelog\n=========\n\n")
-
-            script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
-            subprocess.run(
-                [
-                    "python",
-                    str(script_path),
-                    "1.1.0",
-                    "-m",
-                    "Add feature A",
-                    "-m",
-                    "Add feature B",
-                    "-m",
-                    "Fix bug C",
-                    "--no-commit",
-                ],
-                capture_output=True,
-                text=True,
-                cwd=tmpdir,
-            )
-
-            content = changelog.read_text()
-            assert "- Add feature A" in content
-            assert "- Add feature B" in content
-            assert "- Fix bug C" in content
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_bytes(_PYPROJECT_BYTES)
+
+        changelog = tmp_path / "CHANGELOG.rst"
+        changelog.write_bytes(_CHANGELOG_BYTES)
+
+        script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
+        subprocess.run(
+            [
+                "python",
+                str(script_path),
+                "1.1.0",
+                "-m",
+                "Add feature A",
+                "-m",
+                "Add feature B",
+                "-m",
+                "Fix bug C",
+                "--no-commit",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+        )
+
+        content = changelog.read_text()
+        _assert_all_in(content, ["- Add feature A", "- Add feature B", "- Fix bug C"])
 
 
 class TestEdgeCases:
     """Tests for edge cases."""
 
-    def test_no_changelog_file(self):
+    def test_no_changelog_file(self, git_tmpdir):
         """Should handle missing CHANGELOG.rst gracefully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            # Initialize git
-            subprocess.run(["git", "init"], cwd=tmpdir, capture_output=True)
-            subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=tmpdir, capture_output=True)
-            subprocess.run(["git", "config", "user.name", "Test"], cwd=tmpdir, capture_output=True)
-
-            # Only pyproject.toml, no CHANGELOG.rst
-            pyproject = tmpdir / "pyproject.toml"
-            pyproject.write_text('[project]\nname = "test"\nversion = "1.0.0"\n')
-
-            subprocess.run(["git", "add", "."], cwd=tmpdir, capture_output=True)
-            subprocess.run(["git", "commit", "-m", "Initial"], cwd=tmpdir, capture_output=True)
-
-            script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
-            result = subprocess.run(
-                ["python", str(script_path), "1.1.0", "-m", "Test", "--no-changelog"],
-                capture_output=True,
-                text=True,
-                cwd=tmpdir,
-            )
-
-            # Should succeed
-            assert result.returncode == 0
-            assert 'version = "1.1.0"' in pyproject.read_text()
-
-    def test_version_with_leading_zeros_rejected(self):
-        """Versions with leading zeros should be handled."""
-        # Note: 01.02.03 doesn't match X.Y.Z pattern (single digits)
+        tmpdir = git_tmpdir
+
+        # Only pyproject.toml, no CHANGELOG.rst
+        (tmpdir / "CHANGELOG.rst").unlink()
+        pyproject = tmpdir / "pyproject.toml"
+
+        script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
+        result = subprocess.run(
+            ["python", str(script_path), "1.1.0", "-m", "Test", "--no-changelog"],
+            capture_output=True,
+            text=True,
+            cwd=tmpdir,
+        )
+
+        # Should succeed
+        assert result.returncode == 0
+        assert 'version = "1.1.0"' in pyproject.read_text()
+
+    def test_version_with_leading_zeros_rejected(self, tmp_path):
+        """Versions with leading zeros should be rejected."""
         # Must use temp directory to avoid modifying real project files!
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            pyproject = tmpdir / "pyproject.toml"
-            pyproject.write_text('[project]\nname = "test"\nversion = "1.0.0"\n')
-
-            changelog = tmpdir / "CHANGELOG.rst"
-            changelog.write_text("Changelog\n=========\n")
-
-            script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
-            subprocess.run(
-                ["python", str(script_path), "01.02.03", "-m", "Test"],
-                capture_output=True,
-                text=True,
-                cwd=tmpdir,
-            )
-            # This might be accepted or rejected depending on regex - just document behavior
-            # The regex \d+\.\d+\.\d+ will accept it
-
-    def test_pyproject_with_complex_structure(self):
-        """Should handle complex pyproject.toml."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_bytes(_PYPROJECT_BYTES)
+
+        changelog = tmp_path / "CHANGELOG.rst"
+        changelog.write_bytes(_CHANGELOG_BYTES)
+
+        script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
+        result = subprocess.run(
+            ["python", str(script_path), "01.02.03", "-m", "Test"],
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+        )
+        assert result.returncode != 0
+        assert "leading zero" in result.stdout
+        assert 'version = "1.0.0"' in pyproject.read_text()
 
-            pyproject = tmpdir / "pyproject.toml"
-            pyproject.write_text("""[build-system]
+    def test_pyproject_with_complex_structure(self, bump_version_module, tmp_path):
+        """Should handle complex pyproject.toml."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("""[build-system]
 requires = ["hatchling"]
 build-backend = "hatchling.build"
 
@@ -563,19 +594,8 @@ dev = ["pytest"]
 line-length = 100
 """)
 
-            # Import and test
-            import importlib.util
-
-            script_path = Path(__file__).parent.parent / "scripts" / "bump_version.py"
-            spec = importlib.util.spec_from_file_location("bump_version", script_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            bumper = module.VersionBumper(tmpdir)
-            bumper.update_pyproject_version("2.0.0")
+        bumper = bump_version_module.VersionBumper(tmp_path)
+        bumper.update_pyproject_version("2.0.0")
 
-            content = pyproject.read_text()
-            assert 'version = "2.0.0"' in content
-            assert 'name = "test-project"' in content
-            assert "django>=4.2" in content
-            assert "line-length = 100" in content
+        content = pyproject.read_text()
+        _assert_all_in(content, ['version = "2.0.0"', 'name = "test-project"', "django>=4.2", "line-length = 100"])
@@ -9,196 +9,188 @@ These tests verify that:
 
 from __future__ import annotations
 
+import importlib
+from types import SimpleNamespace
+
 import pytest
+from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
 from django.db import connection
 from django.utils import timezone
 
 from django_fsm_rx import FSMTransitionLog
 
+# The module name starts with a digit, so it can't be imported with a plain import statement
+_data_migration = importlib.import_module("django_fsm_rx.migrations.0003_migrate_django_fsm_log_data")
 
-def migrate_statelog_data_for_test(connection):
-    """
-    Copy data from django_fsm_log_statelog to django_fsm_rx_fsmtransitionlog.
 
-    This is a test-friendly version of the migration function.
-    """
-    # Check if old table exists using Django's introspection (database-agnostic)
-    table_names = connection.introspection.table_names()
+def run_data_migration(**kwargs):
+    """Run migration 0003's data copy against the test database and return the rows copied."""
+    return _data_migration.migrate_statelog_data(apps, SimpleNamespace(connection=connection), **kwargs)
 
-    if "django_fsm_log_statelog" not in table_names:
-        # Old table doesn't exist, nothing to migrate
-        return 0
 
-    with connection.cursor() as cursor:
-        # Check if there's any data to migrate
-        cursor.execute("SELECT COUNT(*) FROM django_fsm_log_statelog")
-        count = cursor.fetchone()[0]
+_INSERT_OLD_SQL = """
+    INSERT INTO django_fsm_log_statelog
+        (timestamp, source_state, state, transition, content_type_id, object_id, description)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
 
-        if count == 0:
-            return 0
-
-        # SQLite: CAST function
-        object_id_cast = "CAST(object_id AS TEXT)"
-
-        # Migrate data
-        cursor.execute(f"""
-            INSERT INTO django_fsm_rx_fsmtransitionlog
-                (content_type_id, object_id, transition_name, source_state, target_state, timestamp, by_id, description)
-            SELECT
-                content_type_id,
-                {object_id_cast},
-                transition,
-                COALESCE(source_state, ''),
-                state,
-                timestamp,
-                by_id,
-                COALESCE(description, '')
-            FROM django_fsm_log_statelog old
-            WHERE NOT EXISTS (
-                SELECT 1 FROM django_fsm_rx_fsmtransitionlog new
-                WHERE new.content_type_id = old.content_type_id
-                AND new.object_id = {object_id_cast}
-                AND new.timestamp = old.timestamp
-                AND new.transition_name = old.transition
-            )
-        """)
-
-        return cursor.rowcount
 
+def _bulk_insert_old(cursor, rows, batch_size=1000):
+    """Insert rows into the old statelog table in executemany batches."""
+    rows = list(rows)
+    for start in range(0, len(rows), batch_size):
+        cursor.executemany(_INSERT_OLD_SQL, rows[start : start + batch_size])
+
+
+# Old table structure matching django-fsm-log's StateLog, plus an index on the dedup key
+_CREATE_OLD_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS django_fsm_log_statelog (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME NOT NULL,
+        by_id INTEGER,
+        source_state VARCHAR(255),
+        state VARCHAR(255) NOT NULL,
+        transition VARCHAR(255) NOT NULL,
+        content_type_id INTEGER NOT NULL,
+        object_id INTEGER NOT NULL,
+        description TEXT
+    );
+    CREATE INDEX IF NOT EXISTS fsm_log_statelog_dedup_idx
+    ON django_fsm_log_statelog (content_type_id, object_id, timestamp, transition);
+"""
 
-@pytest.fixture
-def create_old_statelog_table():
-    """Create the old django_fsm_log_statelog table for testing."""
-    with connection.cursor() as cursor:
-        # Create old table structure matching django-fsm-log's StateLog
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS django_fsm_log_statelog (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp DATETIME NOT NULL,
-                by_id INTEGER,
-                source_state VARCHAR(255),
-                state VARCHAR(255) NOT NULL,
-                transition VARCHAR(255) NOT NULL,
-                content_type_id INTEGER NOT NULL,
-                object_id INTEGER NOT NULL,
-                description TEXT
-            )
-        """)
-    yield
-    # Clean up
-    with connection.cursor() as cursor:
-        cursor.execute("DROP TABLE IF EXISTS django_fsm_log_statelog")
+_DROP_OLD_TABLE_SQL = """
+    DROP TABLE IF EXISTS django_fsm_log_statelog;
+"""
+
+
+@pytest.fixture(scope="class")
+def create_old_statelog_table(request, django_db_setup, django_db_blocker):
+    """Create the old django_fsm_log_statelog table once per test class.
+
+    Rows inserted by each test are rolled back with the test's transaction.
+    """
+
+    def drop_old_table():
+        with django_db_blocker.unblock(), connection.cursor() as cursor:
+            cursor.executescript(_DROP_OLD_TABLE_SQL)
+
+    with django_db_blocker.unblock(), connection.cursor() as cursor:
+        cursor.executescript(_CREATE_OLD_TABLE_SQL)
+    request.addfinalizer(drop_old_table)
 
 
 @pytest.fixture
 def sample_content_type(db):
-    """Get a sample content type for testing."""
+    """Get a sample content type for testing.
+
+    get_for_model caches per process, so repeat lookups don't hit the database.
+    """
     return ContentType.objects.get_for_model(FSMTransitionLog)
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.fixture
+def cursor(db):
+    """Yield one cursor for the whole test instead of opening one per statement group."""
+    with connection.cursor() as cursor:
+        yield cursor
+
+
+@pytest.mark.django_db
 class TestDataMigration:
     """Tests for the data migration from django_fsm_log to django_fsm_rx."""
 
-    def test_migration_copies_data(self, create_old_statelog_table, sample_content_type):
+    @pytest.mark.parametrize(
+        ("source_state", "state", "transition", "object_id", "description", "expected_source", "expected_description"),
+        [
+            ("draft", "published", "publish", 123, "Test transition", "draft", "Test transition"),
+            # NULL source_state and description become empty strings
+            (None, "active", "activate", 789, None, "", ""),
+        ],
+        ids=["copies_data", "null_source_state"],
+    )
+    def test_migration_copies_row(
+        self,
+        create_old_statelog_table,
+        sample_content_type,
+        cursor,
+        source_state,
+        state,
+        transition,
+        object_id,
+        description,
+        expected_source,
+        expected_description,
+    ):
         """Data should be copied from old table to new table."""
         # Insert test data into old table
         now = timezone.now()
-        with connection.cursor() as cursor:
-            cursor.execute(
-                """
-                INSERT INTO django_fsm_log_statelog
-                    (timestamp, source_state, state, transition, content_type_id, object_id, description)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                [now, "draft", "published", "publish", sample_content_type.id, 123, "Test transition"],
-            )
+        _bulk_insert_old(cursor, [(now, source_state, state, transition, sample_content_type.id, object_id, description)])
 
         # Run the migration function
-        migrated = migrate_statelog_data_for_test(connection)
+        migrated = run_data_migration()
         assert migrated == 1
 
         # Verify data was copied
-        log = FSMTransitionLog.objects.get(object_id="123", transition_name="publish")
-        assert log.source_state == "draft"
-        assert log.target_state == "published"
-        assert log.description == "Test transition"
+        log = FSMTransitionLog.objects.get(object_id=str(object_id), transition_name=transition)
+        assert log.source_state == expected_source
+        assert log.target_state == state
+        assert log.description == expected_description
         assert log.content_type == sample_content_type
 
-    def test_migration_is_idempotent(self, create_old_statelog_table, sample_content_type):
+    def test_migration_is_idempotent(self, create_old_statelog_table, sample_content_type, cursor):
         """Running migration multiple times should not create duplicates."""
         now = timezone.now()
-        with connection.cursor() as cursor:
-            cursor.execute(
-                """
-                INSERT INTO django_fsm_log_statelog
-                    (timestamp, source_state, state, transition, content_type_id, object_id, description)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                [now, "new", "done", "finish", sample_content_type.id, 456, ""],
-            )
+        _bulk_insert_old(cursor, [(now, "new", "done", "finish", sample_content_type.id, 456, "")])
 
         # Run migration twice
-        migrate_statelog_data_for_test(connection)
-        migrated = migrate_statelog_data_for_test(connection)
+        assert run_data_migration() == 1
+        migrated = run_data_migration()
 
-        # Second run should migrate 0 (already exists)
+        # Second run should migrate 0 (rows already in the new table are skipped)
         assert migrated == 0
 
         # Should only have one record
-        count = FSMTransitionLog.objects.filter(object_id="456", transition_name="finish").count()
-        assert count == 1
+        rows = list(FSMTransitionLog.objects.filter(object_id="456", transition_name="finish").values_list("pk", flat=True)[:2])
+        assert len(rows) == 1
 
-    def test_migration_handles_null_source_state(self, create_old_statelog_table, sample_content_type):
-        """Migration should handle NULL source_state gracefully."""
+    def test_migration_copies_many_rows(self, create_old_statelog_table, sample_content_type, cursor):
+        """Rows spanning several insert batches and id windows should all be migrated."""
         now = timezone.now()
-        with connection.cursor() as cursor:
-            cursor.execute(
-                """
-                INSERT INTO django_fsm_log_statelog
-                    (timestamp, source_state, state, transition, content_type_id, object_id, description)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                [now, None, "active", "activate", sample_content_type.id, 789, None],
-            )
-
-        migrate_statelog_data_for_test(connection)
-
-        log = FSMTransitionLog.objects.get(object_id="789", transition_name="activate")
-        assert log.source_state == ""  # NULL becomes empty string
-        assert log.description == ""  # NULL becomes empty string
-
-    def test_migration_handles_missing_table(self, db):
-        """Migration should handle missing old table gracefully."""
-        # Ensure old table doesn't exist
-        with connection.cursor() as cursor:
-            cursor.execute("DROP TABLE IF EXISTS django_fsm_log_statelog")
+        _bulk_insert_old(
+            cursor,
+            ((now, "draft", "published", "publish", sample_content_type.id, object_id, "") for object_id in range(2500)),
+        )
 
-        # Should not raise an error, returns 0
-        migrated = migrate_statelog_data_for_test(connection)
-        assert migrated == 0
+        migrated = run_data_migration(chunk_size=1000)
+        assert migrated == 2500
 
-    def test_migration_preserves_old_table(self, create_old_statelog_table, sample_content_type):
+    def test_migration_preserves_old_table(self, create_old_statelog_table, sample_content_type, cursor):
         """Migration should NOT delete data from old table."""
         now = timezone.now()
-        with connection.cursor() as cursor:
-            cursor.execute(
-                """
-                INSERT INTO django_fsm_log_statelog
-                    (timestamp, source_state, state, transition, content_type_id, object_id, description)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                [now, "start", "end", "complete", sample_content_type.id, 999, "Keep me"],
-            )
-
-        migrate_statelog_data_for_test(connection)
+        _bulk_insert_old(cursor, [(now, "start", "end", "complete", sample_content_type.id, 999, "Keep me")])
+
+        run_data_migration()
 
         # Old table should still have the data
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT COUNT(*) FROM django_fsm_log_statelog WHERE object_id = 999")
-            count = cursor.fetchone()[0]
-            assert count == 1, "Old table data should be preserved"
+        cursor.execute("SELECT COUNT(*) FROM django_fsm_log_statelog WHERE object_id = 999")
+        count = cursor.fetchone()[0]
+        assert count == 1, "Old table data should be preserved"
+
+
+@pytest.mark.django_db
+class TestDataMigrationWithoutOldTable:
+    """Tests for the data migration when django_fsm_log was never installed."""
+
+    def test_migration_handles_missing_table(self, cursor):
+        """Migration should handle missing old table gracefully."""
+        # Ensure old table doesn't exist
+        cursor.execute("DROP TABLE IF EXISTS django_fsm_log_statelog")
+
+        # Should not raise an error, returns 0
+        migrated = run_data_migration()
+        assert migrated == 0
 
 
 @pytest.mark.django_db
@@ -211,13 +203,12 @@ class TestStateLogAlias:
 
         assert StateLog is FSMTransitionLog
 
-    def test_statelog_can_create_records(self, db):
+    def test_statelog_can_create_records(self, db, sample_content_type):
         """StateLog should be able to create records (same as FSMTransitionLog)."""
         from django_fsm_log.models import StateLog
 
-        ct = ContentType.objects.get_for_model(FSMTransitionLog)
         log = StateLog.objects.create(
-            content_type=ct,
+            content_type=sample_content_type,
             object_id="test-123",
             transition_name="test_transition",
             source_state="start",
@@ -228,15 +219,13 @@ class TestStateLogAlias:
         assert log.transition_name == "test_transition"
         assert log.target_state == "end"
 
-    def test_statelog_queries_new_table(self, db):
+    def test_statelog_queries_new_table(self, db, sample_content_type):
         """StateLog queries should use the new FSMTransitionLog table."""
         from django_fsm_log.models import StateLog
 
-        ct = ContentType.objects.get_for_model(FSMTransitionLog)
-
         # Create via FSMTransitionLog
         FSMTransitionLog.objects.create(
-            content_type=ct,
+            content_type=sample_content_type,
             object_id="alias-test",
             transition_name="via_fsmtransitionlog",
             source_state="a",
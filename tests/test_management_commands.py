@@ -4,14 +4,48 @@ Tests for django_fsm_rx management commands.
 
 from __future__ import annotations
 
-import tempfile
 from io import StringIO
-from pathlib import Path
 
 import pytest
 from django.core.management import call_command
 from django.core.management.base import CommandError
 
+from django_fsm_rx.management.commands.check_fsm_migration import Command as CheckFSMMigrationCommand
+from django_fsm_rx.migration import MigrationReport
+
+# Files written once per session into the shared corpus, keyed by subdirectory
+_FSM_CORPUS_FILES = {
+    "clean/clean.py": "from django_fsm_rx import FSMField\n",
+    "deprecated/models.py": "from django_fsm import FSMField, transition\n",
+    "verbose/models.py": "from django_fsm import FSMField\n",
+    "migrations_excluded/migrations/0001_initial.py": "from django_fsm import FSMField\n",
+    "multi/admin.py": "from django_fsm import FSMField\nfrom django_fsm_admin.mixins import FSMTransitionMixin\n",
+    "unparseable/models.py": 'from django_fsm import FSMField\nprint "py2"\n',
+    "unparseable_clean/models.py": 'from django_fsm_rx import FSMField\nprint "py2" + django_fsm\n',
+}
+
+
+@pytest.fixture(scope="session")
+def fsm_corpus(tmp_path_factory):
+    """Build one directory tree with a subdirectory per check_fsm_migration scenario."""
+    root = tmp_path_factory.mktemp("fsm_corpus")
+    for relpath, content in _FSM_CORPUS_FILES.items():
+        file_path = root / relpath
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content)
+    return root
+
+
+# check_fsm_migration's argparse defaults, so handle() can be called without call_command
+_CHECK_FSM_MIGRATION_DEFAULTS = vars(CheckFSMMigrationCommand().create_parser("manage.py", "check_fsm_migration").parse_args([]))
+
+
+def _run_check_fsm_migration(path, **options):
+    """Run check_fsm_migration's handle() directly and return its output."""
+    out = StringIO()
+    CheckFSMMigrationCommand(stdout=out).handle(**{**_CHECK_FSM_MIGRATION_DEFAULTS, "path": path, **options})
+    return out.getvalue()
+
 
 class TestCheckFSMMigrationCommand:
     """Tests for check_fsm_migration management command."""
@@ -22,101 +56,90 @@ class TestCheckFSMMigrationCommand:
 
         assert Command is not None
 
-    def test_command_runs_with_clean_directory(self):
+    def test_command_runs_with_clean_directory(self, fsm_corpus):
         """Command should succeed with a directory containing no deprecated imports."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a clean Python file
-            clean_file = Path(tmpdir) / "clean.py"
-            clean_file.write_text("from django_fsm_rx import FSMField\n")
-
-            out = StringIO()
-            call_command("check_fsm_migration", path=tmpdir, stdout=out)
-            output = out.getvalue()
+        # Goes through call_command to keep coverage of command discovery and option parsing
+        out = StringIO()
+        call_command("check_fsm_migration", path=str(fsm_corpus / "clean"), stdout=out)
+        output = out.getvalue()
 
-            assert "No deprecated imports found" in output
+        assert "No deprecated imports found" in output
 
-    def test_command_finds_deprecated_imports(self):
+    def test_command_finds_deprecated_imports(self, fsm_corpus):
         """Command should find deprecated imports."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a file with deprecated import
-            deprecated_file = Path(tmpdir) / "models.py"
-            deprecated_file.write_text("from django_fsm import FSMField, transition\n")
+        output = _run_check_fsm_migration(str(fsm_corpus / "deprecated"))
 
-            out = StringIO()
-            call_command("check_fsm_migration", path=tmpdir, stdout=out)
-            output = out.getvalue()
+        assert "Files affected: 1" in output
+        assert "django_fsm" in output
+        assert "django_fsm_rx" in output
 
-            assert "Files affected: 1" in output
-            assert "django_fsm" in output
-            assert "django_fsm_rx" in output
+    @pytest.mark.parametrize(("options", "expected"), [({}, False), ({"parallel": True}, True)], ids=["default", "flag"])
+    def test_command_parallel_is_opt_in(self, fsm_corpus, monkeypatch, options, expected):
+        """Command should only scan in worker processes when --parallel is given."""
+        calls = []
 
-    def test_command_verbose_output(self):
-        """Command should provide verbose output when requested."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a file with deprecated import
-            deprecated_file = Path(tmpdir) / "models.py"
-            deprecated_file.write_text("from django_fsm import FSMField\n")
+        def fake_scan(*args, **kwargs):
+            calls.append(kwargs)
+            return MigrationReport()
+
+        monkeypatch.setattr("django_fsm_rx.management.commands.check_fsm_migration.scan_imports_in_directory", fake_scan)
+        _run_check_fsm_migration(str(fsm_corpus / "clean"), **options)
 
-            out = StringIO()
-            call_command("check_fsm_migration", path=tmpdir, verbose=True, stdout=out)
-            output = out.getvalue()
+        assert calls[0]["parallel"] is expected
 
-            assert "Migration Guide" in output or "Migration Notes" in output
+    def test_command_verbose_output(self, fsm_corpus):
+        """Command should provide verbose output when requested."""
+        output = _run_check_fsm_migration(str(fsm_corpus / "verbose"), verbose=True)
 
-    def test_command_json_output(self):
+        assert "Migration Guide" in output or "Migration Notes" in output
+
+    def test_command_json_output(self, fsm_corpus):
         """Command should provide JSON output when requested."""
         import json
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a clean file
-            clean_file = Path(tmpdir) / "clean.py"
-            clean_file.write_text("from django_fsm_rx import FSMField\n")
-
-            out = StringIO()
-            call_command("check_fsm_migration", path=tmpdir, json=True, stdout=out)
-            output = out.getvalue()
+        output = _run_check_fsm_migration(str(fsm_corpus / "clean"), json=True)
 
-            # Should be valid JSON
-            data = json.loads(output)
-            assert "is_fully_migrated" in data
-            assert data["is_fully_migrated"] is True
+        # Should be valid JSON
+        data = json.loads(output)
+        assert "is_fully_migrated" in data
+        assert data["is_fully_migrated"] is True
 
-    def test_command_exclude_patterns(self):
+    def test_command_exclude_patterns(self, fsm_corpus):
         """Command should respect exclude patterns."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a deprecated file in migrations directory
-            migrations_dir = Path(tmpdir) / "migrations"
-            migrations_dir.mkdir()
-            deprecated_file = migrations_dir / "0001_initial.py"
-            deprecated_file.write_text("from django_fsm import FSMField\n")
+        output = _run_check_fsm_migration(str(fsm_corpus / "migrations_excluded"), exclude="migrations")
 
-            out = StringIO()
-            call_command("check_fsm_migration", path=tmpdir, exclude="migrations", stdout=out)
-            output = out.getvalue()
-
-            # Should report no issues because migrations are excluded
-            assert "No deprecated imports found" in output
+        # Should report no issues because migrations are excluded
+        assert "No deprecated imports found" in output
 
     def test_command_invalid_path_raises_error(self):
         """Command should raise error for invalid path."""
         with pytest.raises(CommandError) as exc_info:
-            call_command("check_fsm_migration", path="/nonexistent/path/12345")
+            _run_check_fsm_migration("/nonexistent/path/12345")
 
         assert "does not exist" in str(exc_info.value)
 
-    def test_command_handles_multiple_deprecated_packages(self):
+    def test_command_handles_multiple_deprecated_packages(self, fsm_corpus):
         """Command should handle files with imports from multiple deprecated packages."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a file with multiple deprecated imports
-            multi_file = Path(tmpdir) / "admin.py"
-            multi_file.write_text("from django_fsm import FSMField\nfrom django_fsm_admin.mixins import FSMTransitionMixin\n")
+        output = _run_check_fsm_migration(str(fsm_corpus / "multi"))
+
+        assert "django_fsm" in output
+        assert "FSMTransitionMixin" in output or "django_fsm_admin" in output
+
+    def test_command_reports_imports_in_unparseable_file(self, fsm_corpus):
+        """Imports in files that can't be parsed should still be reported, along with a warning."""
+        output = _run_check_fsm_migration(str(fsm_corpus / "unparseable"))
+
+        assert "No deprecated imports found" not in output
+        assert "Line 1:" in output
+        assert "from django_fsm import FSMField" in output
+        assert "Could not parse" in output
 
-            out = StringIO()
-            call_command("check_fsm_migration", path=tmpdir, stdout=out)
-            output = out.getvalue()
+    def test_command_prints_warnings_when_fully_migrated(self, fsm_corpus):
+        """Parse warnings should be printed even when no deprecated imports were found."""
+        output = _run_check_fsm_migration(str(fsm_corpus / "unparseable_clean"))
 
-            assert "django_fsm" in output
-            assert "FSMTransitionMixin" in output or "django_fsm_admin" in output
+        assert "No deprecated imports found" in output
+        assert "Could not parse" in output
 
 
 class TestGraphTransitionsCommand:
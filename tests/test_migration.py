@@ -11,9 +11,8 @@ These tests verify:
 from __future__ import annotations
 
 import sys
-import tempfile
 import warnings
-from pathlib import Path
+from collections.abc import Mapping
 
 import pytest
 from django.db import models
@@ -21,13 +20,28 @@ from django.db import models
 from django_fsm_rx import FSMField
 from django_fsm_rx import FSMModelMixin
 from django_fsm_rx import transition
+from django_fsm_rx.migration import _VALIDATION_CACHE
 from django_fsm_rx.migration import IMPORT_MAPPINGS
+from django_fsm_rx.migration import IMPORT_REPLACEMENTS
+from django_fsm_rx.migration import ImportMapping
 from django_fsm_rx.migration import MigrationReport
 from django_fsm_rx.migration import get_import_replacements
+from django_fsm_rx.migration import is_file_migrated
+from django_fsm_rx.migration import iter_deprecated_imports
 from django_fsm_rx.migration import scan_imports_in_directory
 from django_fsm_rx.migration import scan_imports_in_file
 from django_fsm_rx.migration import validate_model_fsm_compatibility
 
+# The django_fsm_log shim package and its submodules
+_DJANGO_FSM_LOG_MODULES = ("django_fsm_log", "django_fsm_log.decorators", "django_fsm_log.models")
+
+
+@pytest.fixture
+def reset_shim(request):
+    """Forget the given shim modules so importing them runs (and warns) again."""
+    for name in request.param:
+        sys.modules.pop(name, None)
+
 
 class TestMigrationReport:
     """Tests for MigrationReport class."""
@@ -52,6 +66,12 @@ class TestMigrationReport:
         assert len(report.deprecated_imports) == 1
         assert "test.py" in report.files_affected
 
+    def test_report_with_only_warnings_is_fully_migrated(self):
+        """Warnings alone should not mark the report as needing migration."""
+        report = MigrationReport()
+        report.add_warning("Could not read broken.py")
+        assert report.is_fully_migrated is True
+
     def test_report_str_empty(self):
         """Test string representation of empty report."""
         report = MigrationReport()
@@ -89,40 +109,70 @@ class TestImportMappings:
 
     def test_django_fsm_mappings_exist(self):
         """Mappings for django_fsm should exist."""
-        django_fsm_mappings = [m for m in IMPORT_MAPPINGS if m["old_module"] == "django_fsm"]
+        django_fsm_mappings = [m for m in IMPORT_MAPPINGS if m.old_module == "django_fsm"]
         assert len(django_fsm_mappings) > 0
         # Check for key symbols
-        names = [m["old_name"] for m in django_fsm_mappings]
+        names = [m.old_name for m in django_fsm_mappings]
         assert "FSMField" in names
         assert "transition" in names
         assert "can_proceed" in names
 
     def test_django_fsm_2_mappings_exist(self):
         """Mappings for django_fsm_2 should exist."""
-        django_fsm_2_mappings = [m for m in IMPORT_MAPPINGS if m["old_module"] == "django_fsm_2"]
+        django_fsm_2_mappings = [m for m in IMPORT_MAPPINGS if m.old_module == "django_fsm_2"]
         assert len(django_fsm_2_mappings) > 0
 
     def test_django_fsm_admin_mappings_exist(self):
         """Mappings for django_fsm_admin should exist."""
-        admin_mappings = [m for m in IMPORT_MAPPINGS if "django_fsm_admin" in m["old_module"]]
+        admin_mappings = [m for m in IMPORT_MAPPINGS if "django_fsm_admin" in m.old_module]
         assert len(admin_mappings) > 0
         # Check FSMTransitionMixin mapping
-        mixin_mappings = [m for m in admin_mappings if m["old_name"] == "FSMTransitionMixin"]
+        mixin_mappings = [m for m in admin_mappings if m.old_name == "FSMTransitionMixin"]
         assert len(mixin_mappings) > 0
 
     def test_django_fsm_log_mappings_exist(self):
         """Mappings for django_fsm_log should exist."""
-        log_mappings = [m for m in IMPORT_MAPPINGS if "django_fsm_log" in m["old_module"]]
+        log_mappings = [m for m in IMPORT_MAPPINGS if "django_fsm_log" in m.old_module]
         assert len(log_mappings) > 0
         # Check key mappings
-        names = [m["old_name"] for m in log_mappings]
+        names = [m.old_name for m in log_mappings]
         assert "StateLog" in names
         assert "fsm_log_by" in names
 
+    def test_import_mapping_supports_item_access(self):
+        """Mappings should still support the dict-style access they had before becoming dataclasses."""
+        mapping = IMPORT_MAPPINGS[0]
+        assert mapping["old_module"] == mapping.old_module
+        assert mapping["notes"] == mapping.notes
+        with pytest.raises(KeyError):
+            mapping["missing"]
+
+    def test_import_mapping_is_read_only_mapping(self):
+        """Mappings should support the read-only dict protocol, not just item access."""
+        mapping = IMPORT_MAPPINGS[0]
+        assert isinstance(mapping, Mapping)
+        assert "notes" in mapping
+        assert "missing" not in mapping
+        assert mapping.get("missing") is None
+        assert list(mapping) == ["old_module", "old_name", "new_module", "new_name", "notes"]
+        assert dict(mapping)["new_module"] == mapping.new_module
+
+    def test_import_mapping_equals_equivalent_dict(self):
+        """Mappings should compare equal to any Mapping with the same items, as the old dicts did."""
+        mapping = IMPORT_MAPPINGS[0]
+        assert mapping == dict(mapping)
+        assert dict(mapping) == mapping
+        assert mapping != {**mapping, "notes": "changed"}
+        assert mapping != IMPORT_MAPPINGS[1]
+
+        copy = ImportMapping(**mapping)
+        assert copy == mapping
+        assert hash(copy) == hash(mapping)
+
     def test_get_import_replacements(self):
-        """Test get_import_replacements returns valid dict."""
+        """Test get_import_replacements returns a valid mapping."""
         replacements = get_import_replacements()
-        assert isinstance(replacements, dict)
+        assert isinstance(replacements, Mapping)
         assert len(replacements) > 0
 
         # Check specific replacement
@@ -130,6 +180,13 @@ class TestImportMappings:
         assert key in replacements
         assert replacements[key] == "from django_fsm_rx import FSMField"
 
+    def test_get_import_replacements_is_shared_and_read_only(self):
+        """The replacements are built once and can't be modified by callers."""
+        replacements = get_import_replacements()
+        assert replacements is IMPORT_REPLACEMENTS
+        with pytest.raises(TypeError):
+            replacements["from django_fsm import FSMField"] = "changed"  # type: ignore[index]
+
 
 class TestScanImportsInFile:
     """Tests for scan_imports_in_file function."""
@@ -140,65 +197,156 @@ class TestScanImportsInFile:
         assert len(report.warnings) == 1
         assert "not found" in report.warnings[0]
 
-    def test_scan_non_python_file(self):
+    def test_scan_non_python_file(self, tmp_path):
         """Scanning non-Python file should return empty report."""
-        with tempfile.NamedTemporaryFile(suffix=".txt", mode="w", delete=False) as f:
-            f.write("from django_fsm import FSMField")
-            f.flush()
-            report = scan_imports_in_file(f.name)
-            # Non-.py files should be skipped
-            assert report.is_fully_migrated
-
-    def test_scan_file_with_deprecated_import(self):
+        txt_file = tmp_path / "notes.txt"
+        txt_file.write_text("from django_fsm import FSMField")
+
+        report = scan_imports_in_file(str(txt_file))
+        # Non-.py files should be skipped
+        assert report.is_fully_migrated
+
+    def test_scan_file_with_deprecated_import(self, tmp_path):
         """Scanning file with deprecated import should find it."""
-        with tempfile.NamedTemporaryFile(suffix=".py", mode="w", delete=False) as f:
-            f.write("from django_fsm import FSMField, transition\n")
-            f.write("from django.db import models\n")
-            f.flush()
+        py_file = tmp_path / "sample.py"
+        py_file.write_text("from django_fsm import FSMField, transition\nfrom django.db import models\n")
 
-            report = scan_imports_in_file(f.name)
-            assert report.is_fully_migrated is False
-            assert len(report.deprecated_imports) >= 1
+        report = scan_imports_in_file(str(py_file))
+        assert report.is_fully_migrated is False
+        assert len(report.deprecated_imports) >= 1
 
-    def test_scan_file_with_clean_imports(self):
+    def test_scan_file_with_clean_imports(self, tmp_path):
         """Scanning file with modern imports should be clean."""
-        with tempfile.NamedTemporaryFile(suffix=".py", mode="w", delete=False) as f:
-            f.write("from django_fsm_rx import FSMField, transition\n")
-            f.write("from django.db import models\n")
-            f.flush()
+        py_file = tmp_path / "sample.py"
+        py_file.write_text("from django_fsm_rx import FSMField, transition\nfrom django.db import models\n")
 
-            report = scan_imports_in_file(f.name)
-            assert report.is_fully_migrated is True
+        report = scan_imports_in_file(str(py_file))
+        assert report.is_fully_migrated is True
 
-    def test_scan_file_with_comment(self):
+    def test_scan_file_with_comment(self, tmp_path):
         """Scanning should ignore commented imports."""
-        with tempfile.NamedTemporaryFile(suffix=".py", mode="w", delete=False) as f:
-            f.write("# from django_fsm import FSMField\n")
-            f.write("from django_fsm_rx import FSMField\n")
-            f.flush()
+        py_file = tmp_path / "sample.py"
+        py_file.write_text("# from django_fsm import FSMField\nfrom django_fsm_rx import FSMField\n")
 
-            report = scan_imports_in_file(f.name)
-            assert report.is_fully_migrated is True
+        report = scan_imports_in_file(str(py_file))
+        assert report.is_fully_migrated is True
 
-    def test_scan_file_with_django_fsm_admin_import(self):
+    def test_scan_file_with_django_fsm_admin_import(self, tmp_path):
         """Scanning should detect django_fsm_admin imports."""
-        with tempfile.NamedTemporaryFile(suffix=".py", mode="w", delete=False) as f:
-            f.write("from django_fsm_admin.mixins import FSMTransitionMixin\n")
-            f.flush()
+        py_file = tmp_path / "sample.py"
+        py_file.write_text("from django_fsm_admin.mixins import FSMTransitionMixin\n")
 
-            report = scan_imports_in_file(f.name)
-            assert report.is_fully_migrated is False
-            assert any("FSMTransitionMixin" in imp["old"] for imp in report.deprecated_imports)
+        report = scan_imports_in_file(str(py_file))
+        assert report.is_fully_migrated is False
+        assert any("FSMTransitionMixin" in imp["old"] for imp in report.deprecated_imports)
 
-    def test_scan_file_with_django_fsm_log_import(self):
+    def test_scan_file_with_django_fsm_log_import(self, tmp_path):
         """Scanning should detect django_fsm_log imports."""
-        with tempfile.NamedTemporaryFile(suffix=".py", mode="w", delete=False) as f:
-            f.write("from django_fsm_log.models import StateLog\n")
-            f.flush()
+        py_file = tmp_path / "sample.py"
+        py_file.write_text("from django_fsm_log.models import StateLog\n")
+
+        report = scan_imports_in_file(str(py_file))
+        assert report.is_fully_migrated is False
+        assert any("StateLog" in imp["old"] for imp in report.deprecated_imports)
+
+    def test_scan_file_with_parenthesized_import(self, tmp_path):
+        """Scanning should find every name in a multiline import, at the statement's line."""
+        py_file = tmp_path / "models.py"
+        py_file.write_text("import os\nfrom django_fsm import (\n    FSMField,\n    transition,\n)\n")
+
+        report = scan_imports_in_file(py_file)
+        assert [(imp["line"], imp["old"]) for imp in report.deprecated_imports] == [
+            (2, "from django_fsm import FSMField"),
+            (2, "from django_fsm import transition"),
+        ]
+
+    def test_scan_file_with_plain_module_import(self, tmp_path):
+        """Plain ``import`` statements of deprecated modules should be detected, including nested ones."""
+        py_file = tmp_path / "signals.py"
+        py_file.write_text("def connect():\n    import django_fsm.signals\n")
+
+        report = scan_imports_in_file(py_file)
+        assert [(imp["line"], imp["old"], imp["new"]) for imp in report.deprecated_imports] == [
+            (2, "import django_fsm.signals", "import django_fsm_rx.signals"),
+        ]
+
+    def test_scan_file_ignores_import_in_string(self, tmp_path):
+        """Import text inside a string literal is not an import."""
+        py_file = tmp_path / "docs.py"
+        py_file.write_text('EXAMPLE = "from django_fsm import FSMField"\n')
+
+        report = scan_imports_in_file(py_file)
+        assert report.is_fully_migrated is True
+
+    def test_scan_file_with_syntax_error(self, tmp_path):
+        """Files that cannot be parsed should add a warning."""
+        py_file = tmp_path / "broken.py"
+        py_file.write_text("from django_fsm import (\n")
+
+        report = scan_imports_in_file(py_file)
+        assert report.is_fully_migrated is True
+        assert len(report.warnings) == 1
+        assert "Could not parse" in report.warnings[0]
+
+    def test_scan_unparseable_file_falls_back_to_line_scan(self, tmp_path):
+        """Imports in files ast.parse rejects (e.g. Python 2) should still be reported."""
+        py_file = tmp_path / "legacy.py"
+        py_file.write_text('from django_fsm import FSMField, transition  # old\nimport django_fsm_2\nprint "py2"\n')
+
+        report = scan_imports_in_file(py_file)
+        assert [(item["line"], item["old"]) for item in report.deprecated_imports] == [
+            (1, "from django_fsm import FSMField"),
+            (1, "from django_fsm import transition"),
+            (2, "import django_fsm_2"),
+        ]
+        assert "line-based scan" in report.warnings[0]
+
+    def test_scan_file_skips_parsing_without_deprecated_names(self, tmp_path):
+        """Files that never mention a deprecated package are not parsed at all."""
+        py_file = tmp_path / "legacy.py"
+        py_file.write_text("from django_fsm_rx import FSMField\nprint 'python 2'\n")
+
+        report = scan_imports_in_file(py_file)
+        assert report.is_fully_migrated is True
+        assert report.warnings == []
+
+    def test_scan_file_rescans_after_edit(self, tmp_path):
+        """Cached parse results should not hide edits to the file."""
+        py_file = tmp_path / "models.py"
+        py_file.write_text("from django_fsm_rx import FSMField\n")
+        assert scan_imports_in_file(py_file).is_fully_migrated is True
+
+        py_file.write_text("from django_fsm import FSMField\n")
+        assert scan_imports_in_file(py_file).is_fully_migrated is False
+
+
+class TestIterDeprecatedImports:
+    """Tests for iter_deprecated_imports and is_file_migrated."""
+
+    def test_iter_deprecated_imports_is_lazy(self, tmp_path):
+        """Findings should be yielded one at a time, in source order."""
+        py_file = tmp_path / "models.py"
+        py_file.write_text("from django_fsm import FSMField\nfrom django_fsm_log.models import StateLog\n")
 
-            report = scan_imports_in_file(f.name)
-            assert report.is_fully_migrated is False
-            assert any("StateLog" in imp["old"] for imp in report.deprecated_imports)
+        findings = iter_deprecated_imports(py_file)
+        assert next(findings)["old"] == "from django_fsm import FSMField"
+        assert next(findings)["old"] == "from django_fsm_log.models import StateLog"
+        assert next(findings, None) is None
+
+    def test_iter_deprecated_imports_raises_for_missing_file(self):
+        """Unlike scan_imports_in_file, read errors are raised."""
+        with pytest.raises(OSError):
+            list(iter_deprecated_imports("/nonexistent/path/file.py"))
+
+    def test_is_file_migrated(self, tmp_path):
+        """is_file_migrated should reflect whether any deprecated import is present."""
+        clean_file = tmp_path / "clean.py"
+        clean_file.write_text("from django_fsm_rx import FSMField\n")
+        deprecated_file = tmp_path / "deprecated.py"
+        deprecated_file.write_text("from django_fsm import FSMField, transition\n")
+
+        assert is_file_migrated(clean_file) is True
+        assert is_file_migrated(deprecated_file) is False
 
 
 class TestScanImportsInDirectory:
@@ -210,33 +358,65 @@ class TestScanImportsInDirectory:
         assert len(report.warnings) == 1
         assert "not found" in report.warnings[0]
 
-    def test_scan_directory_with_mixed_files(self):
+    def test_scan_directory_with_mixed_files(self, tmp_path):
         """Scanning directory should find deprecated imports."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create file with deprecated import
-            deprecated_file = Path(tmpdir) / "models.py"
-            deprecated_file.write_text("from django_fsm import FSMField\n")
+        # Create file with deprecated import
+        deprecated_file = tmp_path / "models.py"
+        deprecated_file.write_text("from django_fsm import FSMField\n")
 
-            # Create clean file
-            clean_file = Path(tmpdir) / "views.py"
-            clean_file.write_text("from django_fsm_rx import FSMField\n")
+        # Create clean file
+        clean_file = tmp_path / "views.py"
+        clean_file.write_text("from django_fsm_rx import FSMField\n")
 
-            report = scan_imports_in_directory(tmpdir)
-            assert report.is_fully_migrated is False
-            assert str(deprecated_file) in report.files_affected
-            assert str(clean_file) not in report.files_affected
+        report = scan_imports_in_directory(str(tmp_path))
+        assert report.is_fully_migrated is False
+        assert str(deprecated_file) in report.files_affected
+        assert str(clean_file) not in report.files_affected
 
-    def test_scan_directory_excludes_patterns(self):
+    def test_scan_directory_excludes_patterns(self, tmp_path):
         """Scanning should exclude specified patterns."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create file in excluded directory
-            migrations_dir = Path(tmpdir) / "migrations"
-            migrations_dir.mkdir()
-            excluded_file = migrations_dir / "0001_initial.py"
-            excluded_file.write_text("from django_fsm import FSMField\n")
+        # Create file in excluded directory
+        migrations_dir = tmp_path / "migrations"
+        migrations_dir.mkdir()
+        excluded_file = migrations_dir / "0001_initial.py"
+        excluded_file.write_text("from django_fsm import FSMField\n")
 
-            report = scan_imports_in_directory(tmpdir, exclude_patterns=["migrations"])
-            assert report.is_fully_migrated is True
+        report = scan_imports_in_directory(str(tmp_path), exclude_patterns=["migrations"])
+        assert report.is_fully_migrated is True
+
+    def test_scan_directory_excludes_nested_directories(self, tmp_path):
+        """Excluded directories should be skipped at any depth, without hiding sibling files."""
+        nested = tmp_path / "app" / "migrations"
+        nested.mkdir(parents=True)
+        (nested / "0001_initial.py").write_text("from django_fsm import FSMField\n")
+        models_file = tmp_path / "app" / "models.py"
+        models_file.write_text("from django_fsm import FSMField\n")
+
+        report = scan_imports_in_directory(tmp_path, exclude_patterns=["migrations"])
+        assert report.files_affected == {str(models_file)}
+
+    def test_scan_directory_in_parallel_matches_serial(self, tmp_path, monkeypatch):
+        """Scanning in worker processes should report the same findings as a serial scan."""
+        for index in range(4):
+            (tmp_path / f"module_{index}.py").write_text("from django_fsm import FSMField\nfrom django_fsm_2 import transition\n")
+        (tmp_path / "clean.py").write_text("from django_fsm_rx import FSMField\n")
+        monkeypatch.setattr("django_fsm_rx.migration._PARALLEL_MIN_FILES", 1)
+
+        parallel_report = scan_imports_in_directory(tmp_path, parallel=True)
+        serial_report = scan_imports_in_directory(tmp_path)
+
+        assert parallel_report.deprecated_imports == serial_report.deprecated_imports
+        assert parallel_report.files_affected == serial_report.files_affected
+        assert len(parallel_report.deprecated_imports) == 8
+
+    def test_scan_directory_is_serial_by_default(self, tmp_path, monkeypatch):
+        """Worker processes should only be used when a caller opts in."""
+        (tmp_path / "models.py").write_text("from django_fsm import FSMField\n")
+        monkeypatch.setattr("django_fsm_rx.migration._PARALLEL_MIN_FILES", 1)
+        monkeypatch.setattr("django_fsm_rx.migration.ProcessPoolExecutor", None)
+
+        report = scan_imports_in_directory(tmp_path)
+        assert len(report.deprecated_imports) == 1
 
 
 class TestValidateModelFSMCompatibility:
@@ -304,29 +484,40 @@ class TestValidateModelFSMCompatibility:
         warnings_list = validate_model_fsm_compatibility(ProtectedWithMixin)
         assert len(warnings_list) == 0
 
+    def test_validate_model_result_is_cached_per_class(self):
+        """Repeated validation reuses the cached result but returns a fresh list."""
+
+        class CachedPlainModel(models.Model):
+            name = models.CharField(max_length=100)
+
+            class Meta:
+                app_label = "testapp"
+
+        first = validate_model_fsm_compatibility(CachedPlainModel)
+        assert CachedPlainModel in _VALIDATION_CACHE
+
+        first.clear()
+        second = validate_model_fsm_compatibility(CachedPlainModel)
+        assert second is not first
+        assert len(second) == 1
+        assert "no FSM fields" in second[0]
+
 
 class TestDjangoFSMShimBackwardsCompatibility:
     """Tests for django_fsm backwards compatibility shim."""
 
-    def test_django_fsm_imports_work(self):
+    @pytest.mark.parametrize("reset_shim", [("django_fsm",)], indirect=True)
+    def test_django_fsm_imports_work(self, reset_shim):
         """Imports from django_fsm should work with deprecation warning."""
-        # Clear cached import
-        if "django_fsm" in sys.modules:
-            del sys.modules["django_fsm"]
-
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
+        with pytest.warns(DeprecationWarning):
             import django_fsm
 
-            # Should have deprecation warning
-            assert any(issubclass(x.category, DeprecationWarning) for x in w)
-
-            # Core symbols should be available
-            assert hasattr(django_fsm, "FSMField")
-            assert hasattr(django_fsm, "FSMIntegerField")
-            assert hasattr(django_fsm, "transition")
-            assert hasattr(django_fsm, "can_proceed")
-            assert hasattr(django_fsm, "TransitionNotAllowed")
+        # Core symbols should be available
+        assert hasattr(django_fsm, "FSMField")
+        assert hasattr(django_fsm, "FSMIntegerField")
+        assert hasattr(django_fsm, "transition")
+        assert hasattr(django_fsm, "can_proceed")
+        assert hasattr(django_fsm, "TransitionNotAllowed")
 
     def test_django_fsm_signals_work(self):
         """Imports from django_fsm.signals should work."""
@@ -341,64 +532,41 @@ class TestDjangoFSMShimBackwardsCompatibility:
 class TestDjangoFSM2ShimBackwardsCompatibility:
     """Tests for django_fsm_2 backwards compatibility shim."""
 
-    def test_django_fsm_2_imports_work(self):
+    @pytest.mark.parametrize("reset_shim", [("django_fsm_2",)], indirect=True)
+    def test_django_fsm_2_imports_work(self, reset_shim):
         """Imports from django_fsm_2 should work with deprecation warning."""
-        # Clear cached import
-        if "django_fsm_2" in sys.modules:
-            del sys.modules["django_fsm_2"]
-
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
+        with pytest.warns(DeprecationWarning):
             import django_fsm_2
 
-            # Should have deprecation warning
-            assert any(issubclass(x.category, DeprecationWarning) for x in w)
-
-            # Core symbols should be available
-            assert hasattr(django_fsm_2, "FSMField")
-            assert hasattr(django_fsm_2, "transition")
-            assert hasattr(django_fsm_2, "can_proceed")
+        # Core symbols should be available
+        assert hasattr(django_fsm_2, "FSMField")
+        assert hasattr(django_fsm_2, "transition")
+        assert hasattr(django_fsm_2, "can_proceed")
 
 
 class TestDjangoFSMAdminShimBackwardsCompatibility:
     """Tests for django_fsm_admin backwards compatibility shim."""
 
-    def test_django_fsm_admin_imports_work(self):
+    @pytest.mark.parametrize("reset_shim", [("django_fsm_admin", "django_fsm_admin.mixins")], indirect=True)
+    def test_django_fsm_admin_imports_work(self, reset_shim):
         """Imports from django_fsm_admin should work with deprecation warning."""
-        # Clear cached imports
-        for mod in list(sys.modules.keys()):
-            if "django_fsm_admin" in mod:
-                del sys.modules[mod]
-
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
+        with pytest.warns(DeprecationWarning):
             import django_fsm_admin
 
-            # Should have deprecation warning
-            assert any(issubclass(x.category, DeprecationWarning) for x in w)
+        # FSMTransitionMixin should be available
+        assert hasattr(django_fsm_admin, "FSMTransitionMixin")
+        assert hasattr(django_fsm_admin, "FSMAdminMixin")
 
-            # FSMTransitionMixin should be available
-            assert hasattr(django_fsm_admin, "FSMTransitionMixin")
-            assert hasattr(django_fsm_admin, "FSMAdminMixin")
-
-    def test_django_fsm_admin_mixins_imports_work(self):
+    @pytest.mark.parametrize("reset_shim", [("django_fsm_admin", "django_fsm_admin.mixins")], indirect=True)
+    def test_django_fsm_admin_mixins_imports_work(self, reset_shim):
         """Imports from django_fsm_admin.mixins should work."""
-        # Clear cached imports
-        for mod in list(sys.modules.keys()):
-            if "django_fsm_admin" in mod:
-                del sys.modules[mod]
-
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
+        with pytest.warns(DeprecationWarning):
             from django_fsm_admin.mixins import FSMTransitionMixin
 
-            # Should have deprecation warning
-            assert any(issubclass(x.category, DeprecationWarning) for x in w)
-
-            # FSMTransitionMixin should be the same as FSMAdminMixin
-            from django_fsm_rx.admin import FSMAdminMixin
+        # FSMTransitionMixin should be the same as FSMAdminMixin
+        from django_fsm_rx.admin import FSMAdminMixin
 
-            assert FSMTransitionMixin is FSMAdminMixin
+        assert FSMTransitionMixin is FSMAdminMixin
 
 
 class TestDjangoFSMLogShimBackwardsCompatibility:
@@ -412,42 +580,27 @@ class TestDjangoFSMLogShimBackwardsCompatibility:
         # StateLog is an alias to FSMTransitionLog
         assert StateLog is FSMTransitionLog
 
-    def test_django_fsm_log_decorators_import_works(self):
+    @pytest.mark.parametrize("reset_shim", [_DJANGO_FSM_LOG_MODULES], indirect=True)
+    def test_django_fsm_log_decorators_import_works(self, reset_shim):
         """Imports from django_fsm_log.decorators should work."""
-        # Clear cached imports
-        for mod in list(sys.modules.keys()):
-            if "django_fsm_log" in mod:
-                del sys.modules[mod]
-
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
+        with pytest.warns(DeprecationWarning):
             from django_fsm_log.decorators import fsm_log_by
-            from django_fsm_log.decorators import fsm_log_description
 
-            # Should have deprecation warning
-            assert any(issubclass(x.category, DeprecationWarning) for x in w)
+        from django_fsm_log.decorators import fsm_log_description
 
-            # Decorators should be callable
-            assert callable(fsm_log_by)
-            assert callable(fsm_log_description)
+        # Decorators should be callable
+        assert callable(fsm_log_by)
+        assert callable(fsm_log_description)
 
-    def test_django_fsm_log_main_import_works(self):
+    @pytest.mark.parametrize("reset_shim", [_DJANGO_FSM_LOG_MODULES], indirect=True)
+    def test_django_fsm_log_main_import_works(self, reset_shim):
         """Imports from django_fsm_log should work."""
-        # Clear cached imports
-        for mod in list(sys.modules.keys()):
-            if "django_fsm_log" in mod:
-                del sys.modules[mod]
-
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
+        with pytest.warns(DeprecationWarning):
             import django_fsm_log
 
-            # Should have deprecation warning
-            assert any(issubclass(x.category, DeprecationWarning) for x in w)
-
-            # Decorators should be available
-            assert hasattr(django_fsm_log, "fsm_log_by")
-            assert hasattr(django_fsm_log, "fsm_log_description")
+        # Decorators should be available
+        assert hasattr(django_fsm_log, "fsm_log_by")
+        assert hasattr(django_fsm_log, "fsm_log_description")
 
 
 class TestMigrationAPICompatibility:
@@ -613,7 +766,10 @@ class TestMigrationModule:
         assert hasattr(migration, "MigrationReport")
         assert hasattr(migration, "scan_imports_in_file")
         assert hasattr(migration, "scan_imports_in_directory")
+        assert hasattr(migration, "iter_deprecated_imports")
+        assert hasattr(migration, "is_file_migrated")
         assert hasattr(migration, "get_import_replacements")
+        assert hasattr(migration, "IMPORT_REPLACEMENTS")
         assert hasattr(migration, "validate_model_fsm_compatibility")
         assert hasattr(migration, "IMPORT_MAPPINGS")
 
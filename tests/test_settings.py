@@ -51,6 +51,11 @@ class TestDefaultSettings:
         expected_keys = {"ATOMIC", "AUDIT_LOG", "AUDIT_LOG_MODE", "AUDIT_LOG_MODEL", "PROTECTED_FIELDS"}
         assert set(DEFAULTS.keys()) == expected_keys
 
+    def test_defaults_are_read_only(self):
+        """DEFAULTS should not be mutable at runtime."""
+        with pytest.raises(TypeError):
+            DEFAULTS["ATOMIC"] = False  # type: ignore[index]
+
 
 class TestCustomSettings:
     """Tests for custom settings override."""
@@ -109,6 +114,18 @@ class TestSettingsCache:
         settings.clear_cache()
         assert settings._cached_settings is None
 
+    def test_clear_cache_resets_cached_attributes(self):
+        """Settings read before clear_cache should be re-read afterwards."""
+        settings = FSMRXSettings()
+        assert settings.ATOMIC is True
+
+        with override_settings(DJANGO_FSM_RX={"ATOMIC": False}):
+            settings.clear_cache()
+            assert settings.ATOMIC is False
+
+        settings.clear_cache()
+        assert settings.ATOMIC is True
+
 
 class TestInvalidSettings:
     """Tests for invalid setting access."""
@@ -146,3 +163,12 @@ class TestSingletonInstance:
         assert fsm_rx_settings.ATOMIC is True
         assert fsm_rx_settings.AUDIT_LOG is True
         assert fsm_rx_settings.AUDIT_LOG_MODE == "transaction"
+
+    def test_singleton_reloads_on_setting_changed(self):
+        """fsm_rx_settings should pick up override_settings without a manual clear_cache."""
+        assert fsm_rx_settings.AUDIT_LOG is True
+
+        with override_settings(DJANGO_FSM_RX={"AUDIT_LOG": False}):
+            assert fsm_rx_settings.AUDIT_LOG is False
+
+        assert fsm_rx_settings.AUDIT_LOG is True